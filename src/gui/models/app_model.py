@@ -44,6 +44,9 @@ class ProcessingState:
     progress_percentage: float = 0.0
     estimated_time_remaining: float = 0.0
     can_cancel: bool = True
+    elapsed_time: float = 0.0
+    processing_speed: float = 0.0
+    can_pause: bool = False
 
 
 class AppModel:
@@ -152,18 +155,18 @@ class AppModel:
             'invalid': invalid_files
         }
 
-    def add_images_from_directory(self, directory_path: str, recursive: bool = False) -> Dict[str, List[str]]:
+    def find_images_in_directory(self, directory_path: str, recursive: bool = False) -> Optional[List[str]]:
         """
-        Добавляет все изображения из директории.
+        Ищет файлы изображений в директории, не изменяя список (безопасно вызывать из рабочего потока).
 
         :param directory_path: Путь к директории
         :param recursive: Рекурсивный поиск в подпапках
-        :return: Словарь с результатами добавления
+        :return: Список путей к найденным файлам или None если директория недоступна
         """
         try:
             directory = Path(directory_path)
             if not directory.exists() or not directory.is_dir():
-                return {'added': [], 'skipped': [], 'invalid': [directory_path]}
+                return None
 
             # Ищем файлы изображений
             image_files = []
@@ -178,14 +181,26 @@ class AppModel:
                     image_files.extend(directory.glob(f"*{ext.upper()}"))
 
             # Преобразуем в строки путей
-            file_paths = [str(path) for path in image_files]
-
-            return self.add_images(file_paths)
+            return [str(path) for path in image_files]
 
         except Exception as e:
-            self.logger.error(f"Ошибка при добавлении файлов из директории {directory_path}: {e}")
+            self.logger.error(f"Ошибка при поиске файлов в директории {directory_path}: {e}")
+            return None
+
+    def add_images_from_directory(self, directory_path: str, recursive: bool = False) -> Dict[str, List[str]]:
+        """
+        Добавляет все изображения из директории.
+
+        :param directory_path: Путь к директории
+        :param recursive: Рекурсивный поиск в подпапках
+        :return: Словарь с результатами добавления
+        """
+        file_paths = self.find_images_in_directory(directory_path, recursive)
+        if file_paths is None:
             return {'added': [], 'skipped': [], 'invalid': [directory_path]}
 
+        return self.add_images(file_paths)
+
     def remove_image(self, index: int) -> bool:
         """
         Удаляет изображение из списка по индексу.
@@ -73,11 +73,20 @@ class MainPresenter:
         self.main_view = view
         self.logger.debug("Главное представление установлено")
 
+    def _notify_view(self, callback, *args) -> None:
+        """
+        Вызывает метод представления в потоке GUI (модели могут меняться из фоновых потоков).
+
+        :param callback: Метод представления
+        :param args: Аргументы вызова
+        """
+        self.main_view.run_in_gui_thread(callback, *args)
+
     def _on_images_changed(self) -> None:
         """Обработчик изменений в списке изображений."""
         if self.main_view:
-            self.main_view.update_image_list()
-            self.main_view.update_statistics()
+            self._notify_view(self.main_view.update_image_list)
+            self._notify_view(self.main_view.update_statistics)
 
     def _on_processing_state_changed(self, state: ProcessingState) -> None:
         """
@@ -86,7 +95,7 @@ class MainPresenter:
         :param state: Новое состояние обработки
         """
         if self.main_view:
-            self.main_view.update_processing_state(state)
+            self._notify_view(self.main_view.update_processing_state, state)
 
     def _on_settings_changed(self) -> None:
         """Обработчик изменений настроек."""
@@ -127,7 +136,32 @@ class MainPresenter:
         :param recursive: Рекурсивный поиск
         :return: Результат добавления файлов
         """
-        result = self.app_model.add_images_from_directory(directory_path, recursive)
+        file_paths = self.app_model.find_images_in_directory(directory_path, recursive)
+        return self.add_directory_files(directory_path, file_paths)
+
+    def find_directory_images(self, directory_path: str, recursive: bool = False) -> Optional[List[str]]:
+        """
+        Ищет изображения в директории без изменения списка файлов.
+        Может вызываться из рабочего потока; результат передается в add_directory_files.
+
+        :param directory_path: Путь к директории
+        :param recursive: Рекурсивный поиск
+        :return: Список путей или None если директория недоступна
+        """
+        return self.app_model.find_images_in_directory(directory_path, recursive)
+
+    def add_directory_files(self, directory_path: str, file_paths: Optional[List[str]]) -> Dict[str, List[str]]:
+        """
+        Добавляет найденные в директории файлы (вызывается в потоке GUI).
+
+        :param directory_path: Путь к директории
+        :param file_paths: Результат find_directory_images
+        :return: Результат добавления файлов
+        """
+        if file_paths is None:
+            return {'added': [], 'skipped': [], 'invalid': [directory_path]}
+
+        result = self.add_files(file_paths)
 
         # Обновляем последнюю директорию в настройках
         if result['added'] and self.settings_model.gui_settings.remember_last_directory:
@@ -256,16 +290,18 @@ class MainPresenter:
     # Методы для обработки OCR
     # ===============================
 
-    def can_start_processing(self) -> bool:
+    def can_start_processing(self, stats: Optional[Dict[str, Any]] = None) -> bool:
         """
         Проверяет, можно ли начать обработку.
 
+        :param stats: Уже полученная статистика (чтобы не пересчитывать ее повторно)
         :return: True если можно начать обработку
         """
         if self.app_model.processing_state.is_running:
             return False
 
-        if self.app_model.get_valid_image_count() == 0:
+        valid_files = stats['valid_files'] if stats is not None else self.app_model.get_valid_image_count()
+        if valid_files == 0:
             return False
 
         if not self.ocr_processor:
@@ -381,7 +417,7 @@ class MainPresenter:
 
         # Уведомляем представление о завершении
         if self.main_view:
-            self.main_view.on_processing_completed(result)
+            self._notify_view(self.main_view.on_processing_completed, result)
 
     def _on_processing_error(self, error_message: str) -> None:
         """
@@ -392,7 +428,7 @@ class MainPresenter:
         self.logger.error(f"Ошибка обработки: {error_message}")
 
         if self.main_view:
-            self.main_view.on_processing_error(error_message)
+            self._notify_view(self.main_view.on_processing_error, error_message)
 
     # ============================
     # Методы для получения данных
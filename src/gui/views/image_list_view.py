@@ -7,6 +7,8 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import os
 import logging
+import platform
+import subprocess
 from typing import List, Optional
 
 from ..models.app_model import ImageFile
@@ -17,6 +19,19 @@ try:
 except ImportError:
     MainPresenter = None
 
+# Платформа определяется один раз при загрузке модуля
+_SYSTEM = platform.system()
+
+if _SYSTEM == "Windows":
+    def _reveal_command(file_path: str) -> List[str]:
+        return ["explorer", "/select,", file_path]
+elif _SYSTEM == "Darwin":  # macOS
+    def _reveal_command(file_path: str) -> List[str]:
+        return ["open", "-R", file_path]
+else:  # Linux
+    def _reveal_command(file_path: str) -> List[str]:
+        return ["xdg-open", os.path.dirname(file_path)]
+
 
 class ImageListView(tk.Frame):
     """
@@ -44,6 +59,9 @@ class ImageListView(tk.Frame):
         self.context_menu: Optional[tk.Menu] = None
         self.selected_item_index: int = -1
 
+        # Пути файлов в порядке строк treeview (для восстановления выбора после перестроения)
+        self._row_paths: List[str] = []
+
         # Создаем GUI
         self._create_gui()
         self._setup_bindings()
@@ -115,6 +133,10 @@ class ImageListView(tk.Frame):
         tree_container.grid_rowconfigure(0, weight=1)
         tree_container.grid_columnconfigure(0, weight=1)
 
+        # Настраиваем теги для цветового кодирования
+        self.treeview.tag_configure("valid", foreground="#27ae60")
+        self.treeview.tag_configure("invalid", foreground="#e74c3c")
+
         # Создаем контекстное меню
         self._create_context_menu()
 
@@ -171,41 +193,70 @@ class ImageListView(tk.Frame):
 
         :param files: Список файлов для отображения
         """
+        # Запоминаем выбранные файлы по пути - их позиции могут измениться
+        row_paths = self._row_paths
+        selected_paths = {row_paths[i] for i in self.get_selected_files() if 0 <= i < len(row_paths)}
+
         # Очищаем текущий список
         for item in self.treeview.get_children():
             self.treeview.delete(item)
 
         # Добавляем новые файлы
         for i, file_info in enumerate(files, 1):
-            # Форматируем размер файла
-            size_str = self._format_file_size(file_info.size)
+            self._insert_row(i, file_info)
+        self._row_paths = [f.path for f in files]
+
+        # Восстанавливаем выбор
+        if selected_paths:
+            children = self.treeview.get_children()
+            items = [children[i] for i, path in enumerate(self._row_paths) if path in selected_paths]
+            if items:
+                self.treeview.selection_set(items)
+                self.treeview.focus(items[0])
+                self.treeview.see(items[0])
 
-            # Определяем статус и цвет
-            if file_info.is_valid:
-                status = "✅ OK"
-                tags = ("valid",)
-            else:
-                status = "❌ Ошибка"
-                tags = ("invalid",)
-
-            # Добавляем элемент
-            item_id = self.treeview.insert(
-                "",
-                tk.END,
-                text=str(i),
-                values=(file_info.filename, size_str, status),
-                tags=tags
-            )
+        # Обновляем информационную панель
+        self._update_info_label(files)
 
-            # Сохраняем индекс файла в item_id для обратной связи
-            # Используем file_info.path как уникальный идентификатор
+    def insert_rows(self, files: List[ImageFile], all_files: List[ImageFile]) -> None:
+        """
+        Добавляет строки в конец списка без перестроения уже отображенных.
 
-        # Настраиваем теги для цветового кодирования
-        self.treeview.tag_configure("valid", foreground="#27ae60")
-        self.treeview.tag_configure("invalid", foreground="#e74c3c")
+        :param files: Новые файлы, добавленные в конец списка
+        :param all_files: Полный список файлов (для информационной панели)
+        """
+        start = len(self.treeview.get_children()) + 1
+        for i, file_info in enumerate(files, start):
+            self._insert_row(i, file_info)
+        self._row_paths.extend(f.path for f in files)
 
-        # Обновляем информационную панель
-        self._update_info_label(files)
+        self._update_info_label(all_files)
+
+    def _insert_row(self, number: int, file_info: ImageFile) -> None:
+        """
+        Добавляет одну строку в конец treeview.
+
+        :param number: Номер строки (начинается с 1)
+        :param file_info: Информация о файле
+        """
+        # Форматируем размер файла
+        size_str = self._format_file_size(file_info.size)
+
+        # Определяем статус и цвет
+        if file_info.is_valid:
+            status = "✅ OK"
+            tags = ("valid",)
+        else:
+            status = "❌ Ошибка"
+            tags = ("invalid",)
+
+        self.treeview.insert(
+            "",
+            tk.END,
+            text=str(number),
+            values=(file_info.filename, size_str, status),
+            tags=tags
+        )
 
     def _update_info_label(self, files: List[ImageFile]) -> None:
         """
@@ -375,10 +426,11 @@ class ImageListView(tk.Frame):
 
         index = self._get_selected_file_index()
         if index > 0:
+            file_info = self.presenter.get_file_info(index)
             success = self.presenter.move_file(index, index - 1)
-            if success:
-                # Восстанавливаем выбор на новой позиции
-                self._select_item_by_index(index - 1)
+            if success and file_info:
+                # Выбор следует за файлом и после отложенного перестроения списка
+                self._select_item_by_path(file_info.path)
 
     def _on_move_down(self) -> None:
         """Перемещает файл вниз по списку."""
@@ -389,10 +441,11 @@ class ImageListView(tk.Frame):
         total_files = len(self.presenter.get_image_files())
 
         if index >= 0 and index < total_files - 1:
+            file_info = self.presenter.get_file_info(index)
             success = self.presenter.move_file(index, index + 1)
-            if success:
-                # Восстанавливаем выбор на новой позиции
-                self._select_item_by_index(index + 1)
+            if success and file_info:
+                # Выбор следует за файлом и после отложенного перестроения списка
+                self._select_item_by_path(file_info.path)
 
     def _on_show_in_explorer(self) -> None:
         """Показывает файл в проводнике системы."""
@@ -401,16 +454,12 @@ class ImageListView(tk.Frame):
             return
 
         try:
-            import platform
-            import subprocess
-
-            if platform.system() == "Windows":
-                subprocess.run(["explorer", "/select,", file_info.path])
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.run(["open", "-R", file_info.path])
-            else:  # Linux
-                subprocess.run(["xdg-open", os.path.dirname(file_info.path)])
-
+            # Popen не ждет завершения файлового менеджера и не блокирует GUI
+            subprocess.Popen(
+                _reveal_command(file_info.path),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
         except Exception as e:
             self.logger.error(f"Не удалось показать файл в проводнике: {e}")
             messagebox.showerror("Ошибка", f"Не удалось открыть проводник:\n{e}")
@@ -529,6 +578,17 @@ class ImageListView(tk.Frame):
             self.treeview.focus(item_id)
             self.treeview.see(item_id)
 
+    def _select_item_by_path(self, path: str) -> None:
+        """
+        Выбирает строку с указанным файлом в текущем содержимом списка.
+
+        :param path: Путь к файлу
+        """
+        try:
+            self._select_item_by_index(self._row_paths.index(path))
+        except ValueError:
+            pass
+
     def get_selected_files(self) -> List[int]:
         """
         Возвращает индексы всех выбранных файлов.
@@ -5,8 +5,16 @@
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+from tkinter import font as tkfont
 import logging
-from typing import Optional, List
+import os
+import platform
+import queue
+import subprocess
+import threading
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, List, Tuple
 
 from ..models.app_model import ProcessingState
 from ..widgets.drag_drop_frame import DragDropFrame
@@ -23,6 +31,99 @@ except ImportError:
     MainPresenter = None
     OCRBatchResult = None
 
+# Платформа определяется один раз при загрузке модуля
+_SYSTEM = platform.system()
+
+# Минимальные высоты панелей при 96 DPI; фактическая высота берется из метрик шрифта
+_HEADER_MIN_HEIGHT = 40
+_CONTROL_MIN_HEIGHT = 40
+_STATUS_MIN_HEIGHT = 22
+
+
+def _startfile_quietly(file_path: str) -> None:
+    """
+    Открывает файл через os.startfile, логируя ошибки (выполняется в фоновом потоке).
+
+    :param file_path: Путь к файлу
+    """
+    try:
+        os.startfile(file_path)
+    except OSError as e:
+        logging.getLogger(__name__).error(f"Не удалось открыть файл {file_path}: {e}")
+
+
+def _popen_detached(cmd: List[str]) -> None:
+    """
+    Запускает внешнюю команду без ожидания завершения и без привязки к GUI процессу.
+
+    :param cmd: Команда и аргументы
+    """
+    subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+
+if _SYSTEM == "Windows":
+    def _open_with_system_app(file_path: str) -> None:
+        # os.startfile может блокироваться (например, на UNC путях)
+        threading.Thread(target=_startfile_quietly, args=(file_path,), daemon=True).start()
+elif _SYSTEM == "Darwin":  # macOS
+    def _open_with_system_app(file_path: str) -> None:
+        _popen_detached(["open", file_path])
+else:  # Linux
+    def _open_with_system_app(file_path: str) -> None:
+        _popen_detached(["xdg-open", file_path])
+
+
+# Цвета для кнопок
+_BUTTON_COLORS = MappingProxyType({
+    'primary': {'bg': '#3498db', 'fg': 'white', 'hover_bg': '#2980b9'},
+    'success': {'bg': '#27ae60', 'fg': 'white', 'hover_bg': '#229954'},
+    'danger': {'bg': '#e74c3c', 'fg': 'white', 'hover_bg': '#c0392b'},
+    'warning': {'bg': '#f39c12', 'fg': 'white', 'hover_bg': '#e67e22'}
+})
+
+
+@lru_cache(maxsize=None)
+def _resolve_style(style: str) -> Tuple[str, str, str]:
+    """
+    Возвращает цвета кнопки для указанного стиля.
+
+    :param style: Стиль кнопки ('primary', 'success', 'danger', 'warning')
+    :return: Кортеж (bg, fg, hover_bg)
+    """
+    colors = _BUTTON_COLORS.get(style, _BUTTON_COLORS['primary'])
+    return colors['bg'], colors['fg'], colors['hover_bg']
+
+
+# Типы файлов для диалога выбора изображений
+_FILE_TYPES = (
+    ("Изображения", "*.png *.jpg *.jpeg *.tiff *.bmp *.gif"),
+    ("PNG файлы", "*.png"),
+    ("JPEG файлы", "*.jpg *.jpeg"),
+    ("Все файлы", "*.*")
+)
+
+# Текст справки
+_HELP_TEXT = """OCR AI or Offline - Инструмент для распознавания текста
+
+Как использовать:
+1. Добавьте изображения через кнопки или перетащите файлы
+2. Выберите режим обработки (Offline/Online)
+3. Настройте параметры в правой панели
+4. Нажмите "Начать обработку OCR"
+
+Поддерживаемые форматы:
+• PNG, JPG, JPEG, TIFF, BMP, GIF
+
+Режимы обработки:
+• Offline: Tesseract OCR (быстро, без интернета)
+• Online: ИИ модели (более точно, требует интернет)
+"""
+
 
 class MainView(tk.Frame):
     """
@@ -30,6 +131,18 @@ class MainView(tk.Frame):
     Координирует все GUI компоненты и взаимодействует с presenter.
     """
 
+    # Минимальный интервал между обновлениями прогресса (~30 Гц); единственный
+    # ограничитель частоты и для главного окна, и для диалога прогресса
+    _PROGRESS_FRAME_MS = 33
+
+    # Период опроса очереди фоновых событий там, где нет createfilehandler (Windows):
+    # часто, пока события поступают, и реже в простое
+    _WORKER_POLL_ACTIVE_MS = 16
+    _WORKER_POLL_IDLE_MS = 100
+
+    # Общий bindtag для всех кнопок-фреймов: события обрабатываются одним диспетчером
+    _BUTTON_BINDTAG = "OCRFrameButton"
+
     def __init__(self, parent: tk.Widget):
         """
         Инициализация главного представления.
@@ -48,30 +161,140 @@ class MainView(tk.Frame):
         self.drag_drop_frame: Optional[DragDropFrame] = None
         self.image_list_view: Optional[ImageListView] = None
         self.settings_view: Optional[SettingsView] = None
+        self._settings_parent: Optional[tk.Widget] = None
+        self._settings_placeholder: Optional[tk.Label] = None
         self.progress_view: Optional[ProgressView] = None
 
         # Кнопки управления (теперь Frame-based)
         self.start_button: Optional[tk.Frame] = None
+        self._start_button_running: Optional[tk.Frame] = None
+        self._start_button_mode = 'idle'
         self.clear_button: Optional[tk.Frame] = None
         self.sort_button: Optional[tk.Frame] = None
+        self.add_folder_button: Optional[tk.Frame] = None
 
         # Статусная строка
         self.status_label: Optional[tk.Label] = None
+        self._status_var = tk.StringVar(self, value="Готов к работе")
 
         # Ссылка на правую панель для динамического изменения размера
         self._right_panel_ref: Optional[tk.LabelFrame] = None
 
-        # Цвета для кнопок
-        self.button_colors = {
-            'primary': {'bg': '#3498db', 'fg': 'white', 'hover_bg': '#2980b9'},
-            'success': {'bg': '#27ae60', 'fg': 'white', 'hover_bg': '#229954'},
-            'danger': {'bg': '#e74c3c', 'fg': 'white', 'hover_bg': '#c0392b'},
-            'warning': {'bg': '#f39c12', 'fg': 'white', 'hover_bg': '#e67e22'}
-        }
+        # Ключи (path, is_valid, size) отображенных файлов для инкрементального обновления
+        self._shown_file_keys: List[tuple] = []
+
+        # Последнее отображенное состояние обработки (is_running, current_filename, завершено)
+        self._last_proc = (None, None, None)
+
+        # Последние значения, переданные диалогу прогресса
+        self._last_progress_key: Optional[tuple] = None
+
+        # Отложенное обновление списка и статистики (объединяется в один проход на idle)
+        self._refresh_pending = False
+
+        # Отложенное обновление прогресса (не чаще одного раза за _PROGRESS_FRAME_MS)
+        self._pending_proc_state: Optional[ProcessingState] = None
+        self._proc_after_id: Optional[str] = None
+        # Состояние для виджетов главного окна, отложенное пока окно свернуто
+        self._deferred_main_state: Optional[ProcessingState] = None
+
+        # Мост для событий из фоновых потоков: очередь + пробуждение Tk через pipe
+        self._gui_thread = threading.current_thread()
+        self._worker_events: "queue.Queue" = queue.Queue()
+        self._evt_r: Optional[int] = None
+        self._evt_w: Optional[int] = None
+        self._worker_poll_id: Optional[str] = None
+        self._setup_worker_bridge()
 
         # Создаем GUI
         self._create_gui()
 
+        # Обновления, отложенные пока окно свернуто, применяются при его отображении
+        self.parent.bind('<Map>', self._on_parent_map, add='+')
+
+    def _setup_worker_bridge(self) -> None:
+        """Настраивает пробуждение цикла Tk по записи в pipe (где поддерживается)."""
+        # createfilehandler недоступен в Windows - там очередь опрашивает цикл after() потока GUI
+        if not hasattr(self.tk, 'createfilehandler'):
+            self._poll_worker_events()
+            return
+
+        self._evt_r, self._evt_w = os.pipe()
+        os.set_blocking(self._evt_w, False)
+        self.tk.createfilehandler(self._evt_r, tk.READABLE, self._on_worker_event)
+
+    def run_in_gui_thread(self, callback, *args) -> None:
+        """
+        Выполняет вызов в потоке GUI: сразу, если вызван из него, иначе через очередь.
+
+        :param callback: Вызываемый объект
+        :param args: Аргументы вызова
+        """
+        if threading.current_thread() is self._gui_thread:
+            callback(*args)
+            return
+
+        self._worker_events.put((callback, args))
+
+        # Без pipe событие заберет _poll_worker_events - из рабочего потока Tk не вызывается
+        if self._evt_w is not None:
+            try:
+                os.write(self._evt_w, b'\0')
+            except BlockingIOError:
+                pass  # Pipe уже содержит непрочитанный сигнал
+
+    def _on_worker_event(self, fd, mask) -> None:
+        """
+        Обработчик готовности pipe: сбрасывает сигналы и выполняет события.
+
+        :param fd: Файловый дескриптор
+        :param mask: Маска события
+        """
+        os.read(self._evt_r, 4096)
+        self._drain_worker_events()
+
+    def _poll_worker_events(self) -> None:
+        """Выполняет накопленные фоновые события и планирует следующий опрос (поток GUI)."""
+        interval = self._WORKER_POLL_ACTIVE_MS if self._drain_worker_events() else self._WORKER_POLL_IDLE_MS
+        self._worker_poll_id = self.after(interval, self._poll_worker_events)
+
+    def _drain_worker_events(self) -> bool:
+        """
+        Выполняет все накопленные события из фоновых потоков.
+
+        :return: True если было выполнено хотя бы одно событие
+        """
+        handled = False
+        while True:
+            try:
+                callback, args = self._worker_events.get_nowait()
+            except queue.Empty:
+                return handled
+
+            handled = True
+
+            try:
+                callback(*args)
+            except Exception:
+                self.logger.exception("Ошибка обработки события из фонового потока")
+
+    def destroy(self) -> None:
+        """Освобождает ресурсы моста событий и уничтожает виджет."""
+        if self._worker_poll_id is not None:
+            self.after_cancel(self._worker_poll_id)
+            self._worker_poll_id = None
+
+        if self._evt_r is not None:
+            self.tk.deletefilehandler(self._evt_r)
+            os.close(self._evt_r)
+            os.close(self._evt_w)
+            self._evt_r = self._evt_w = None
+
+        if self.progress_view:
+            self.progress_view.destroy_dialog()
+
+        super().destroy()
+
     def set_presenter(self, presenter) -> None:
         """
         Устанавливает presenter для взаимодействия.
@@ -92,9 +315,10 @@ class MainView(tk.Frame):
 
     def _create_gui(self) -> None:
         """Создает главный интерфейс приложения."""
-        # Главный контейнер
+        self._setup_button_bindings()
+
+        # Главный контейнер (размещается после создания всех секций)
         self.main_frame = tk.Frame(self.parent)
-        self.main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
         # Создаем основные секции
         self._create_header()
@@ -102,16 +326,27 @@ class MainView(tk.Frame):
         self._create_control_buttons()
         self._create_status_bar()
 
+        # Один проход geometry manager по полностью построенному дереву
+        self.main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
     def _create_header(self) -> None:
         """Создает заголовок приложения."""
-        header_frame = tk.Frame(self.main_frame)
+        # Фиксированная высота: изменения текста не вызывают перерасчет layout всего окна.
+        # Высота считается по метрикам шрифтов, чтобы текст не обрезался при HiDPI
+        title_font = ("Arial", 16, "bold")
+        # Кнопки меню: шрифт по умолчанию + pady, рамка и подсветка tk.Button
+        menu_height = self._font_line_height(tkfont.nametofont('TkDefaultFont'), 12)
+        header_height = max(_HEADER_MIN_HEIGHT,
+                            self._font_line_height(title_font, 4), menu_height + 4)
+        header_frame = tk.Frame(self.main_frame, height=header_height)
+        header_frame.pack_propagate(False)
         header_frame.pack(fill=tk.X, pady=(0, 10))
 
         # Заголовок
         title_label = tk.Label(
             header_frame,
             text="🔍 OCR AI or Offline",
-            font=("Arial", 16, "bold"),
+            font=title_font,
             fg="#2c3e50"
         )
         title_label.pack(side=tk.LEFT)
@@ -142,34 +377,30 @@ class MainView(tk.Frame):
 
     def _create_main_content(self) -> None:
         """Создает основное содержимое с исправленными пропорциями."""
-        # Основной контейнер с двумя панелями
-        main_content = tk.Frame(self.main_frame)
+        # Основной контейнер с двумя панелями: ширину панели настроек пользователь меняет
+        # перетаскиванием разделителя, пересчет пропорций на каждый <Configure> не нужен
+        main_content = ttk.PanedWindow(self.main_frame, orient=tk.HORIZONTAL)
         main_content.pack(fill=tk.BOTH, expand=True)
 
-        # ИСПРАВЛЕНИЕ 1: Оптимизированные пропорции панелей
         # Левая панель - изображения
         left_panel = tk.LabelFrame(main_content, text="📁 Изображения", padx=5, pady=5)
-        left_panel.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
 
-        # ИСПРАВЛЕНИЕ: Правая панель с увеличенной шириной (23-25% экрана)
+        # Правая панель - настройки; начальная ширина 280-360px (около 24% окна)
         right_panel = tk.LabelFrame(main_content, text="⚙️ Настройки OCR", padx=5, pady=5)
-        right_panel.pack(side=tk.RIGHT, fill=tk.Y, padx=(5, 0))
 
-        # Адаптивная ширина правой панели: 280-360px (23-25% экрана)
-        self.update_idletasks()
         window_width = self.winfo_width() or 1000
-        # Увеличиваем диапазон: min 280px, max 360px, оптимально 23-25%
         optimal_right_width = min(max(int(window_width * 0.24), 280), 360)
 
         right_panel.configure(width=optimal_right_width)
         right_panel.pack_propagate(False)
 
+        # Растягивается только левая панель
+        main_content.add(left_panel, weight=1)
+        main_content.add(right_panel, weight=0)
+
         # Сохраняем ссылку на правую панель
         self._right_panel_ref = right_panel
 
-        # Привязываем обработчик изменения размера окна
-        self.bind('<Configure>', self.on_window_resize)
-
         self._create_images_panel(left_panel)
         self._create_settings_panel(right_panel)
 
@@ -195,7 +426,7 @@ class MainView(tk.Frame):
         add_files_btn.pack(side=tk.LEFT, padx=(0, 5))
 
         # Кнопка добавления папки
-        add_folder_btn = self._create_button_frame(
+        self.add_folder_button = self._create_button_frame(
             buttons_frame,
             text="📂 Добавить папку",
             command=self._on_add_folder_click,
@@ -203,7 +434,7 @@ class MainView(tk.Frame):
             padx=12,
             pady=4
         )
-        add_folder_btn.pack(side=tk.LEFT, padx=5)
+        self.add_folder_button.pack(side=tk.LEFT, padx=5)
 
         # Кнопка очистки
         self.clear_button = self._create_button_frame(
@@ -226,13 +457,38 @@ class MainView(tk.Frame):
 
         :param parent: Родительский виджет
         """
-        # Настройки OCR - используем существующий SettingsView без изменений
-        self.settings_view = SettingsView(parent)
-        self.settings_view.pack(fill=tk.BOTH, expand=True)
+        # SettingsView создается лениво - при первом отображении панели
+        self._settings_parent = parent
+        self._settings_placeholder = tk.Label(parent, text="Загрузка...", fg="#7f8c8d")
+        self._settings_placeholder.pack(expand=True)
+        self._settings_placeholder.bind('<Map>', lambda e: self._ensure_settings_view())
+
+    def _ensure_settings_view(self) -> SettingsView:
+        """
+        Создает SettingsView при первом обращении.
+
+        :return: Представление настроек
+        """
+        if self.settings_view is None:
+            if self._settings_placeholder is not None:
+                self._settings_placeholder.destroy()
+                self._settings_placeholder = None
+
+            self.settings_view = SettingsView(self._settings_parent)
+            self.settings_view.pack(fill=tk.BOTH, expand=True)
+
+            if self.presenter:
+                self.settings_view.set_presenter(self.presenter)
+
+        return self.settings_view
 
     def _create_control_buttons(self) -> None:
         """Создает кнопки управления обработкой с оптимизированными размерами."""
-        control_frame = tk.Frame(self.main_frame)
+        start_font = ('Arial', 11, 'bold')
+        # Кнопка-фрейм: рамка фрейма (2×2) + pady метки (2×6) + рамка метки (2×2)
+        control_height = max(_CONTROL_MIN_HEIGHT, self._font_line_height(start_font, 20))
+        control_frame = tk.Frame(self.main_frame, height=control_height)
+        control_frame.pack_propagate(False)
         control_frame.pack(fill=tk.X, pady=(8, 0))
 
         # Кнопка сортировки
@@ -246,33 +502,64 @@ class MainView(tk.Frame):
         )
         self.sort_button.pack(side=tk.LEFT)
 
-        # Основная кнопка запуска
+        # Основная кнопка запуска: два заранее созданных варианта (ожидание/обработка)
+        # в общем контейнере, отображается только один из них
+        start_container = tk.Frame(control_frame)
+        start_container.pack(side=tk.RIGHT)
+
         self.start_button = self._create_button_frame(
-            control_frame,
+            start_container,
             text="🚀 Начать обработку OCR",
             command=self._on_start_processing_click,
             style='success',
-            font=('Arial', 11, 'bold'),
+            font=start_font,
             padx=20,
             pady=6
         )
         self.start_button.pack(side=tk.RIGHT)
 
+        self._start_button_running = self._create_button_frame(
+            start_container,
+            text="⏸️ Обработка...",
+            command=None,
+            style='success',
+            font=start_font,
+            padx=20,
+            pady=6
+        )
+        self._set_button_enabled(self._start_button_running, False)
+
     def _create_status_bar(self) -> None:
         """Создает статусную строку с оптимизированной высотой."""
-        status_frame = tk.Frame(self.main_frame, relief=tk.SUNKEN, bd=1)
+        status_font = ('Arial', 9)
+        # Рамка фрейма (2×1) + pady метки (2×1) + рамка метки (2×2)
+        status_height = max(_STATUS_MIN_HEIGHT, self._font_line_height(status_font, 8))
+        status_frame = tk.Frame(self.main_frame, relief=tk.SUNKEN, bd=1, height=status_height)
+        status_frame.pack_propagate(False)
         status_frame.pack(fill=tk.X, pady=(3, 0))
 
         self.status_label = tk.Label(
             status_frame,
-            text="Готов к работе",
+            textvariable=self._status_var,
             anchor=tk.W,
             padx=5,
             pady=1,
-            font=('Arial', 9)
+            font=status_font
         )
         self.status_label.pack(fill=tk.X)
 
+    def _font_line_height(self, font, padding: int) -> int:
+        """
+        Вычисляет высоту строки текста с учетом текущего масштабирования.
+
+        :param font: Описание шрифта или объект tkfont.Font
+        :param padding: Суммарные вертикальные отступы и рамки в пикселях
+        :return: Высота в пикселях
+        """
+        if not isinstance(font, tkfont.Font):
+            font = tkfont.Font(root=self.main_frame, font=font)
+        return font.metrics('linespace') + padding
+
     def _create_button_frame(self, parent: tk.Widget, text: str, command, style: str, **kwargs) -> tk.Frame:
         """
         Создает кнопку-фрейм, обходящую ограничения системных тем.
@@ -284,12 +571,12 @@ class MainView(tk.Frame):
         :param kwargs: Дополнительные параметры
         :return: Frame-кнопка
         """
-        colors = self.button_colors.get(style, self.button_colors['primary'])
+        bg, fg, hover_bg = _resolve_style(style)
 
         # Создаем контейнер-фрейм
         button_frame = tk.Frame(
             parent,
-            bg=colors['bg'],
+            bg=bg,
             relief=tk.RAISED,
             bd=2,
             cursor='hand2'
@@ -299,8 +586,8 @@ class MainView(tk.Frame):
         label = tk.Label(
             button_frame,
             text=text,
-            bg=colors['bg'],
-            fg=colors['fg'],
+            bg=bg,
+            fg=fg,
             font=kwargs.get('font', ('Arial', 9, 'bold')),
             cursor='hand2'
         )
@@ -312,19 +599,51 @@ class MainView(tk.Frame):
 
         # Сохраняем ссылки для hover эффектов
         button_frame._label = label
-        button_frame._original_bg = colors['bg']
-        button_frame._hover_bg = colors['hover_bg']
-        button_frame._fg = colors['fg']
+        button_frame._original_bg = bg
+        button_frame._hover_bg = hover_bg
+        button_frame._fg = fg
         button_frame._enabled = True
+        button_frame._command = command
 
-        # Привязываем события
-        for widget in [button_frame, label]:
-            widget.bind('<Button-1>', lambda e: self._on_button_click(button_frame, command))
-            widget.bind('<Enter>', lambda e: self._on_button_hover(button_frame, True))
-            widget.bind('<Leave>', lambda e: self._on_button_hover(button_frame, False))
+        # Подключаем фрейм и label к общему диспетчеру событий
+        for widget in (button_frame, label):
+            widget._button_frame = button_frame
+            widget.bindtags((self._BUTTON_BINDTAG,) + widget.bindtags())
 
         return button_frame
 
+    def _setup_button_bindings(self) -> None:
+        """Привязывает обработчики событий кнопок-фреймов один раз на уровне bindtag."""
+        self.bind_class(self._BUTTON_BINDTAG, '<Button-1>', self._dispatch_button_click)
+        self.bind_class(self._BUTTON_BINDTAG, '<Enter>', lambda e: self._dispatch_button_hover(e, True))
+        self.bind_class(self._BUTTON_BINDTAG, '<Leave>', lambda e: self._dispatch_button_hover(e, False))
+
+    def _dispatch_button_click(self, event) -> None:
+        """
+        Единый обработчик клика для всех кнопок-фреймов.
+
+        :param event: Событие клика
+        """
+        button_frame = getattr(event.widget, '_button_frame', None)
+        if button_frame is None:
+            return
+
+        try:
+            self._on_button_click(button_frame, button_frame._command)
+        except Exception:
+            self.logger.exception("Ошибка выполнения команды кнопки")
+
+    def _dispatch_button_hover(self, event, is_entering: bool) -> None:
+        """
+        Единый обработчик hover для всех кнопок-фреймов.
+
+        :param event: Событие входа/выхода курсора
+        :param is_entering: True при входе курсора, False при выходе
+        """
+        button_frame = getattr(event.widget, '_button_frame', None)
+        if button_frame is not None:
+            self._on_button_hover(button_frame, is_entering)
+
     def _on_button_click(self, button_frame: tk.Frame, command) -> None:
         """
         Обработчик клика по кнопке-фрейму.
@@ -332,16 +651,13 @@ class MainView(tk.Frame):
         :param button_frame: Frame-кнопка
         :param command: Команда для выполнения
         """
-        if hasattr(button_frame, '_enabled') and button_frame._enabled and command:
+        if button_frame._enabled and command:
             # Эффект нажатия
             button_frame.configure(relief=tk.SUNKEN)
             button_frame.after(100, lambda: button_frame.configure(relief=tk.RAISED))
 
             # Выполняем команду
-            try:
-                command()
-            except Exception as e:
-                self.logger.error(f"Ошибка выполнения команды кнопки: {e}")
+            command()
 
     def _on_button_hover(self, button_frame: tk.Frame, is_entering: bool) -> None:
         """
@@ -372,6 +688,10 @@ class MainView(tk.Frame):
         :param button_frame: Frame-кнопка
         :param enabled: True для включения, False для отключения
         """
+        # Флаг _enabled служит кэшем: повторная настройка того же состояния не нужна
+        if button_frame._enabled == enabled:
+            return
+
         button_frame._enabled = enabled
 
         if enabled:
@@ -389,25 +709,6 @@ class MainView(tk.Frame):
         if hasattr(button_frame, '_label'):
             button_frame._label.configure(bg=bg_color, fg=fg_color, cursor=cursor)
 
-    def on_window_resize(self, event) -> None:
-        """
-        Обработчик изменения размера окна для адаптации пропорций панелей.
-
-        :param event: Событие изменения размера
-        """
-        # Обновляем только если это главное окно
-        if event.widget == self.parent:
-            # Пересчитываем ширину правой панели
-            window_width = event.width
-            optimal_right_width = min(max(int(window_width * 0.24), 280), 360)
-
-            # Обновляем ширину правой панели если она существует
-            if hasattr(self, '_right_panel_ref') and self._right_panel_ref:
-                try:
-                    self._right_panel_ref.configure(width=optimal_right_width)
-                except tk.TclError:
-                    pass
-
     # ========================
     # Обработчики событий
     # ========================
@@ -417,16 +718,9 @@ class MainView(tk.Frame):
         if not self.presenter:
             return
 
-        filetypes = [
-            ("Изображения", "*.png *.jpg *.jpeg *.tiff *.bmp *.gif"),
-            ("PNG файлы", "*.png"),
-            ("JPEG файлы", "*.jpg *.jpeg"),
-            ("Все файлы", "*.*")
-        ]
-
         files = filedialog.askopenfilenames(
             title="Выберите изображения",
-            filetypes=filetypes
+            filetypes=_FILE_TYPES
         )
 
         if files:
@@ -448,8 +742,46 @@ class MainView(tk.Frame):
                 default=messagebox.NO
             )
 
-            result = self.presenter.add_directory(directory, recursive)
-            self._show_add_files_result(result)
+            # Сканирование папки выполняется в фоне, чтобы не блокировать GUI
+            self._set_button_enabled(self.add_folder_button, False)
+            self.update_status("Поиск изображений...")
+
+            threading.Thread(
+                target=self._add_directory_worker,
+                args=(directory, recursive),
+                daemon=True
+            ).start()
+
+    def _add_directory_worker(self, directory: str, recursive: bool) -> None:
+        """
+        Ищет изображения в папке в фоновом потоке.
+        Список файлов здесь не изменяется - найденные пути добавляются в потоке GUI.
+
+        :param directory: Путь к папке
+        :param recursive: Рекурсивный поиск
+        """
+        try:
+            paths = self.presenter.find_directory_images(directory, recursive)
+        except Exception:
+            self.logger.exception(f"Ошибка поиска изображений в папке {directory}")
+            paths = None
+
+        self.run_in_gui_thread(self._on_directory_scanned, directory, paths)
+
+    def _on_directory_scanned(self, directory: str, paths: Optional[List[str]]) -> None:
+        """
+        Добавляет найденные файлы (выполняется в потоке GUI).
+
+        :param directory: Путь к папке
+        :param paths: Найденные пути или None при ошибке
+        """
+        self._set_button_enabled(self.add_folder_button, True)
+
+        result = self.presenter.add_directory_files(directory, paths)
+
+        # Сбрасываем сообщение "Поиск изображений..." актуальной статистикой
+        self.update_statistics()
+        self._show_add_files_result(result)
 
     def _on_clear_click(self) -> None:
         """Обработчик очистки списка файлов."""
@@ -469,6 +801,7 @@ class MainView(tk.Frame):
         current_method = settings.sort_method
 
         self.presenter.sort_files(current_method)
+        self._flush_refresh()
         self.update_status(f"Файлы отсортированы: {settings.get_sort_method_name()}")
 
     def _on_start_processing_click(self) -> None:
@@ -476,6 +809,10 @@ class MainView(tk.Frame):
         if not self.presenter:
             return
 
+        # Правки настроек, еще ожидающие debounce, должны попасть в модель до запуска
+        if self.settings_view is not None:
+            self.settings_view.flush_pending()
+
         if not self.presenter.can_start_processing():
             reasons = []
 
@@ -494,7 +831,7 @@ class MainView(tk.Frame):
 
         # Показываем диалог прогресса
         if self.progress_view:
-            self.progress_view.show_dialog()
+            self.progress_view.show_dialog(self.presenter.get_statistics()['valid_files'])
 
         # Запускаем обработку
         success = self.presenter.start_processing()
@@ -509,22 +846,7 @@ class MainView(tk.Frame):
 
     def _on_help_click(self) -> None:
         """Обработчик справки."""
-        help_text = """OCR AI or Offline - Инструмент для распознавания текста
-
-Как использовать:
-1. Добавьте изображения через кнопки или перетащите файлы
-2. Выберите режим обработки (Offline/Online)
-3. Настройте параметры в правой панели
-4. Нажмите "Начать обработку OCR"
-
-Поддерживаемые форматы:
-• PNG, JPG, JPEG, TIFF, BMP, GIF
-
-Режимы обработки:
-• Offline: Tesseract OCR (быстро, без интернета)
-• Online: ИИ модели (более точно, требует интернет)
-"""
-        messagebox.showinfo("Справка", help_text)
+        messagebox.showinfo("Справка", _HELP_TEXT)
 
     def _show_add_files_result(self, result: dict) -> None:
         """
@@ -532,37 +854,111 @@ class MainView(tk.Frame):
 
         :param result: Результат добавления файлов
         """
-        added = len(result.get('added', []))
-        skipped = len(result.get('skipped', []))
-        invalid = len(result.get('invalid', []))
+        # Применяем отложенную статистику, чтобы она не перезаписала сообщение ниже
+        self._flush_refresh()
+
+        added = len(result.get('added', ()))
+        skipped = len(result.get('skipped', ()))
+        invalid = len(result.get('invalid', ()))
 
         if added > 0:
             self.update_status(f"Добавлено файлов: {added}")
 
-        if skipped > 0 or invalid > 0:
-            messages = []
-            if skipped > 0:
-                messages.append(f"Пропущено (дубликаты): {skipped}")
-            if invalid > 0:
-                messages.append(f"Неверный формат: {invalid}")
+        if skipped == 0 and invalid == 0:
+            return
 
-            messagebox.showwarning(
-                "Добавление файлов",
-                "\n".join(messages)
-            )
+        if invalid == 0:
+            message = f"Пропущено (дубликаты): {skipped}"
+        elif skipped == 0:
+            message = f"Неверный формат: {invalid}"
+        else:
+            message = f"Пропущено (дубликаты): {skipped}\nНеверный формат: {invalid}"
+
+        messagebox.showwarning("Добавление файлов", message)
 
     # ==============================
     # Методы обновления интерфейса
     # ==============================
 
     def update_image_list(self) -> None:
-        """Обновляет список изображений."""
+        """Обновляет список изображений (объединяется с другими обновлениями на idle)."""
+        self._schedule_refresh()
+
+    def update_statistics(self) -> None:
+        """Обновляет статистику (объединяется с другими обновлениями на idle)."""
+        self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        """Планирует одно обновление списка и статистики на ближайший idle цикл Tk."""
+        if self._refresh_pending:
+            return
+
+        self._refresh_pending = True
+
+        # Пока окно свернуто/скрыто, обновление откладывается до события <Map>
+        if self._is_window_viewable():
+            self.after_idle(self._do_refresh)
+
+    def _is_window_viewable(self) -> bool:
+        """
+        Проверяет, отображается ли главное окно (не свернуто и не скрыто).
+
+        :return: True если окно видимо
+        """
+        return bool(self.parent.winfo_viewable())
+
+    def _on_parent_map(self, event) -> None:
+        """
+        Применяет отложенные обновления после отображения главного окна.
+
+        :param event: Событие <Map>
+        """
+        # Событие приходит и от дочерних виджетов через bindtag окна
+        if event.widget is not self.parent:
+            return
+
+        if self._deferred_main_state is not None:
+            state, self._deferred_main_state = self._deferred_main_state, None
+            self._apply_main_state(state)
+
+        if self._refresh_pending:
+            self.after_idle(self._do_refresh)
+
+    def _flush_refresh(self) -> None:
+        """Немедленно выполняет запланированное обновление, если оно есть."""
+        self._do_refresh()
+
+    def _do_refresh(self) -> None:
+        """Выполняет отложенное обновление списка изображений и статистики."""
+        if not self._refresh_pending:
+            return
+
+        self._refresh_pending = False
+        self._refresh_image_list()
+        self._refresh_statistics()
+
+    def _refresh_image_list(self) -> None:
+        """Перестраивает список изображений."""
         if self.image_list_view and self.presenter:
             files = self.presenter.get_image_files()
-            self.image_list_view.update_file_list(files)
+            keys = [(f.path, f.is_valid, f.size) for f in files]
+            shown = self._shown_file_keys
 
-    def update_statistics(self) -> None:
-        """Обновляет статистику."""
+            # Пропускаем перестроение, если порядок и состояние файлов не изменились
+            if keys == shown:
+                return
+
+            if len(keys) > len(shown) and keys[:len(shown)] == shown:
+                # Файлы только добавлены в конец: вставляем лишь новые строки
+                self.image_list_view.insert_rows(files[len(shown):], files)
+            else:
+                # Удаление, сортировка, перемещение или ревалидация: полное перестроение
+                self.image_list_view.update_file_list(files)
+
+            self._shown_file_keys = keys
+
+    def _refresh_statistics(self) -> None:
+        """Обновляет статистику в статусной строке и доступность кнопок."""
         if not self.presenter:
             return
 
@@ -583,32 +979,85 @@ class MainView(tk.Frame):
         else:
             self.update_status("Файлы не добавлены")
 
-        # Обновляем доступность кнопок
-        self._update_button_states()
+        # Обновляем доступность кнопок, переиспользуя уже полученную статистику
+        self._update_button_states(stats, self.presenter.get_processing_state())
 
     def update_settings_display(self) -> None:
         """Обновляет отображение настроек."""
-        if self.settings_view:
+        if self.settings_view is None:
+            # set_presenter при создании уже загружает значения из модели
+            self._ensure_settings_view()
+        else:
             self.settings_view.update_from_model()
 
     def update_processing_state(self, state: ProcessingState) -> None:
         """
         Обновляет состояние обработки.
 
+        :param state: Состояние обработки
+        """
+        self._pending_proc_state = state
+
+        if not state.is_running:
+            # Конечное состояние применяем сразу
+            self._flush_processing_state()
+        elif self._proc_after_id is None:
+            self._proc_after_id = self.after(self._PROGRESS_FRAME_MS, self._flush_processing_state)
+
+    def _flush_processing_state(self) -> None:
+        """Применяет последнее полученное состояние обработки."""
+        if self._proc_after_id is not None:
+            self.after_cancel(self._proc_after_id)
+            self._proc_after_id = None
+
+        state = self._pending_proc_state
+        self._pending_proc_state = None
+        if state is None:
+            return
+
+        # Диалог прогресса и мини-окно - отдельные окна: обновляются и при свернутом главном окне
+        # (время учитывается с точностью до секунды - так оно и отображается)
+        progress_key = (state.is_running, state.progress_percentage, state.current_filename,
+                        int(state.elapsed_time), state.processing_speed)
+        if self.progress_view and progress_key != self._last_progress_key:
+            self._last_progress_key = progress_key
+            self.progress_view.update_progress(state)
+
+        # Виджеты свернутого главного окна обновятся при <Map>
+        if not self._is_window_viewable():
+            self._deferred_main_state = state
+            return
+
+        self._deferred_main_state = None
+        self._apply_main_state(state)
+
+    def _apply_main_state(self, state: ProcessingState) -> None:
+        """
+        Применяет состояние обработки к главному окну, если отображаемые данные изменились.
+
+        :param state: Состояние обработки
+        """
+        key = (state.is_running, state.current_filename, state.progress_percentage >= 100)
+
+        if key != self._last_proc:
+            self._last_proc = key
+            self._apply_processing_state(state)
+
+    def _apply_processing_state(self, state: ProcessingState) -> None:
+        """
+        Применяет состояние обработки к кнопке запуска и статусной строке.
+
         :param state: Состояние обработки
         """
         if state.is_running:
-            # Обновляем текст и отключаем кнопку запуска
-            if hasattr(self.start_button, '_label'):
-                self.start_button._label.configure(text="⏸️ Обработка...")
-            self._set_button_enabled(self.start_button, False)
+            # Показываем вариант кнопки "Обработка..."
+            self._show_start_button('running')
 
             if state.current_filename:
                 self.update_status(f"Обрабатывается: {state.current_filename}")
         else:
             # Восстанавливаем кнопку запуска
-            if hasattr(self.start_button, '_label'):
-                self.start_button._label.configure(text="🚀 Начать обработку OCR")
+            self._show_start_button('idle')
             self._set_button_enabled(self.start_button, True)
 
             if state.progress_percentage >= 100:
@@ -616,9 +1065,23 @@ class MainView(tk.Frame):
             else:
                 self.update_status("Готов к работе")
 
-        # Обновляем прогресс диалог
-        if self.progress_view:
-            self.progress_view.update_progress(state)
+    def _show_start_button(self, mode: str) -> None:
+        """
+        Переключает видимый вариант кнопки запуска.
+
+        :param mode: 'idle' - кнопка запуска, 'running' - индикатор обработки
+        """
+        if mode == self._start_button_mode:
+            return
+
+        if mode == 'running':
+            self.start_button.pack_forget()
+            self._start_button_running.pack(side=tk.RIGHT)
+        else:
+            self._start_button_running.pack_forget()
+            self.start_button.pack(side=tk.RIGHT)
+
+        self._start_button_mode = mode
 
     def update_status(self, message: str) -> None:
         """
@@ -626,17 +1089,27 @@ class MainView(tk.Frame):
 
         :param message: Сообщение для отображения
         """
-        if self.status_label:
-            self.status_label.configure(text=message)
+        if message != self._status_var.get():
+            self._status_var.set(message)
+
+    def _update_button_states(self, stats: Optional[dict] = None,
+                              state: Optional[ProcessingState] = None) -> None:
+        """
+        Обновляет состояние кнопок в зависимости от контекста.
 
-    def _update_button_states(self) -> None:
-        """Обновляет состояние кнопок в зависимости от контекста."""
+        :param stats: Статистика файлов (запрашивается у presenter, если не передана)
+        :param state: Состояние обработки (запрашивается у presenter, если не передано)
+        """
         if not self.presenter:
             return
 
-        stats = self.presenter.get_statistics()
+        if stats is None:
+            stats = self.presenter.get_statistics()
+        if state is None:
+            state = self.presenter.get_processing_state()
+
         has_files = stats['valid_files'] > 0
-        is_processing = self.presenter.get_processing_state().is_running
+        is_processing = state.is_running
 
         # Кнопка очистки
         if self.clear_button:
@@ -648,7 +1121,7 @@ class MainView(tk.Frame):
 
         # Кнопка запуска
         if self.start_button:
-            can_start = self.presenter.can_start_processing()
+            can_start = self.presenter.can_start_processing(stats)
             self._set_button_enabled(self.start_button, can_start)
 
     # =======================
@@ -661,11 +1134,18 @@ class MainView(tk.Frame):
 
         :param result: Результат обработки OCRBatchResult
         """
-        # Скрываем диалог прогресса
+        # Скрываем диалог прогресса до показа результатов
         if self.progress_view:
-            self.progress_view.hide_dialog()
+            self.after_idle(self.progress_view.hide_dialog)
 
-        # Показываем результат
+        self.after_idle(self._show_processing_result, result)
+
+    def _show_processing_result(self, result) -> None:
+        """
+        Показывает итоги обработки и планирует предложение открыть результат.
+
+        :param result: Результат обработки OCRBatchResult
+        """
         success_rate = result.successful_files / result.total_files * 100 if result.total_files > 0 else 0
 
         message = (
@@ -677,7 +1157,16 @@ class MainView(tk.Frame):
 
         messagebox.showinfo("Обработка завершена", message)
 
-        # Предлагаем открыть результат
+        # Второй диалог показываем после возврата в mainloop, чтобы успели
+        # выполниться накопившиеся обновления интерфейса
+        self.after(0, self._ask_open_result, result)
+
+    def _ask_open_result(self, result) -> None:
+        """
+        Предлагает открыть файл с результатами.
+
+        :param result: Результат обработки OCRBatchResult
+        """
         if messagebox.askyesno("Открыть результат", "Открыть файл с результатами?"):
             self._open_result_file(result.output_file_path)
 
@@ -700,16 +1189,7 @@ class MainView(tk.Frame):
         :param file_path: Путь к файлу
         """
         try:
-            import os
-            import platform
-
-            if platform.system() == "Windows":
-                os.startfile(file_path)
-            elif platform.system() == "Darwin":  # macOS
-                os.system(f"open '{file_path}'")
-            else:  # Linux
-                os.system(f"xdg-open '{file_path}'")
-
+            _open_with_system_app(file_path)
         except Exception as e:
             self.logger.error(f"Не удалось открыть файл {file_path}: {e}")
             messagebox.showerror("Ошибка", f"Не удалось открыть файл:\n{e}")
@@ -6,7 +6,8 @@
 import tkinter as tk
 from tkinter import ttk
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Dict, Any, Callable
 
 from ..models.app_model import ProcessingState
 
@@ -16,6 +17,112 @@ try:
 except ImportError:
     MainPresenter = None
 
+# Шаблоны строк прогресса (bound-методы format создаются один раз)
+_FMT_TIME = "Время: {:02d}:{:02d}".format
+_FMT_SPEED = "Скорость: {:.1f} файлов/мин".format
+_FMT_PERCENT = "{:.1f}%".format
+_FMT_REMAINING = "Обрабатываем... (осталось: {})".format
+
+# Вид кнопки отмены по режимам: во время обработки и после ее завершения
+# (диалог переиспользуется, поэтому режим "running" восстанавливает исходный вид)
+_CANCEL_BUTTON_MODES = {
+    "running": {"state": tk.NORMAL, "text": "❌ Отменить", "bg": "#e74c3c"},
+    "done": {"text": "✅ Закрыть", "bg": "#27ae60"},
+}
+
+# Именованные ttk стили надписей диалога (настраиваются один раз на приложение)
+_LABEL_STYLES = (
+    ("Progress.Title.TLabel", ("Arial", 14, "bold"), "#2c3e50"),
+    ("Progress.Heading.TLabel", ("Arial", 10, "bold"), "#000000"),
+    ("Progress.Percent.TLabel", ("Arial", 9), "#3498db"),
+    ("Progress.File.TLabel", ("Arial", 9), "#34495e"),
+    ("Progress.Info.TLabel", ("Arial", 9), "#7f8c8d"),
+)
+_styles_initialized = False
+
+
+def _init_styles() -> None:
+    """Регистрирует ttk стили диалога прогресса при первом создании диалога."""
+    global _styles_initialized
+    if _styles_initialized:
+        return
+
+    style = ttk.Style()
+    for name, font, foreground in _LABEL_STYLES:
+        style.configure(name, font=font, foreground=foreground)
+
+    _styles_initialized = True
+
+
+class _AsyncConfirm:
+    """
+    Немодальное окно подтверждения.
+    В отличие от messagebox не блокирует обработчик кнопки: цикл событий продолжает
+    работать, и прогресс обновляется, пока пользователь принимает решение.
+    """
+
+    def __init__(self, parent: tk.Widget, title: str, text: str,
+                 on_yes: Callable[[], None], on_no: Optional[Callable[[], None]] = None,
+                 with_cancel: bool = False):
+        """
+        Создает и показывает окно подтверждения.
+
+        :param parent: Родительское окно
+        :param title: Заголовок окна
+        :param text: Текст вопроса
+        :param on_yes: Вызывается при ответе "Да"
+        :param on_no: Вызывается при ответе "Нет" (None - ничего не делать)
+        :param with_cancel: Добавить кнопку "Отмена" (закрывает окно без действий)
+        """
+        self.window = tk.Toplevel(parent)
+        self.window.title(title)
+        self.window.resizable(False, False)
+        self.window.transient(parent)
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        frame = tk.Frame(self.window, padx=20, pady=15)
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        tk.Label(frame, text=text, justify=tk.LEFT).pack(anchor=tk.W, pady=(0, 15))
+
+        buttons = tk.Frame(frame)
+        buttons.pack(fill=tk.X)
+
+        if with_cancel:
+            tk.Button(buttons, text="Отмена", width=10, command=self.close).pack(side=tk.RIGHT)
+        tk.Button(buttons, text="Нет", width=10,
+                  command=lambda: self._answer(on_no)).pack(side=tk.RIGHT, padx=(0, 5))
+        tk.Button(buttons, text="Да", width=10,
+                  command=lambda: self._answer(on_yes)).pack(side=tk.RIGHT, padx=(0, 5))
+
+        self.window.lift()
+        self.window.focus_set()
+
+    def exists(self) -> bool:
+        """
+        Проверяет, открыто ли еще окно.
+
+        :return: True если окно не закрыто
+        """
+        return self.window is not None and bool(self.window.winfo_exists())
+
+    def close(self) -> None:
+        """Закрывает окно без ответа."""
+        if self.window is not None:
+            self.window.destroy()
+            self.window = None
+
+    def _answer(self, callback: Optional[Callable[[], None]]) -> None:
+        """
+        Закрывает окно и выполняет выбранное действие на следующем idle.
+
+        :param callback: Действие для выбранного ответа
+        """
+        root = self.window.master
+        self.close()
+        if callback is not None:
+            root.after_idle(callback)
+
 
 class ProgressView:
     """
@@ -23,6 +130,10 @@ class ProgressView:
     Показывает детальную информацию о ходе обработки.
     """
 
+    # Размер диалога прогресса
+    _DIALOG_WIDTH = 500
+    _DIALOG_HEIGHT = 300
+
     def __init__(self, parent: tk.Widget):
         """
         Инициализация представления прогресса.
@@ -38,22 +149,50 @@ class ProgressView:
         # Диалоговое окно
         self.dialog: Optional[tk.Toplevel] = None
 
+        # Мини-окно прогресса (создается при первом сворачивании и переиспользуется)
+        self.mini_window: Optional[tk.Toplevel] = None
+        self._mini_progress: Optional[ttk.Progressbar] = None
+
+        # Размер экрана (запрашивается один раз при первом сворачивании)
+        self._screen_size: Optional[tuple] = None
+
+        # Текущая шкала прогресс-баров (число файлов)
+        self._bar_maximum = 100
+
         # Переменные для отображения
         self.progress_var = tk.DoubleVar()
         self.current_file_var = tk.StringVar()
         self.status_var = tk.StringVar()
         self.time_var = tk.StringVar()
         self.speed_var = tk.StringVar()
+        self.progress_percent_var = tk.StringVar()
 
         # Виджеты
         self.progress_bar: Optional[ttk.Progressbar] = None
-        self.current_file_label: Optional[tk.Label] = None
-        self.status_label: Optional[tk.Label] = None
-        self.time_label: Optional[tk.Label] = None
-        self.speed_label: Optional[tk.Label] = None
+        self.current_file_label: Optional[ttk.Label] = None
+        self.status_label: Optional[ttk.Label] = None
+        self.time_label: Optional[ttk.Label] = None
+        self.speed_label: Optional[ttk.Label] = None
         self.cancel_button: Optional[tk.Button] = None
         self.pause_button: Optional[tk.Button] = None
 
+        # Последние записанные значения переменных (по id переменной)
+        self._last_vals: Dict[int, Any] = {}
+
+        # Последняя отображенная секунда времени обработки
+        self._last_elapsed_s = -1
+
+        # Диалог скрыт в фон: обновляются только переменные мини-окна
+        self._minimized = False
+        self._deferred_state: Optional[ProcessingState] = None
+
+        # Открытое окно подтверждения (отмена/закрытие)
+        self._confirm: Optional[_AsyncConfirm] = None
+
+        # Текущие режимы кнопок (None - еще не настраивались); configure только при смене
+        self._cancel_mode: Optional[str] = None
+        self._pause_mode: Optional[str] = None
+
         # Состояние
         self.is_visible = False
         self.can_pause = False
@@ -66,41 +205,86 @@ class ProgressView:
         """
         self.presenter = presenter
 
-    def show_dialog(self) -> None:
-        """Показывает диалог прогресса."""
+    def show_dialog(self, total_files: int = 0) -> None:
+        """
+        Показывает диалог прогресса.
+
+        :param total_files: Количество файлов к обработке (модальность нужна только для пакета)
+        """
         if self.is_visible:
             return
 
-        self._create_dialog()
+        modal = total_files > 1
+        if self.dialog is not None and self.dialog.winfo_exists():
+            # Диалог уже построен - только показываем его заново
+            self._center_dialog()
+            self.dialog.deiconify()
+            if modal:
+                self.dialog.grab_set()
+        else:
+            self._create_dialog(modal=modal)
+
         self.is_visible = True
+        self._minimized = False
+        self._deferred_state = None
+        self._cancel_mode = None
+        self._pause_mode = None
+        self._last_elapsed_s = -1
 
         # Инициализируем начальные значения
-        self.progress_var.set(0)
-        self.current_file_var.set("Подготовка...")
-        self.status_var.set("Запуск обработки")
-        self.time_var.set("Время: 00:00")
-        self.speed_var.set("Скорость: -- файлов/мин")
+        self._set(self.progress_var, 0)
+        self._set(self.progress_percent_var, "0%")
+        self._set(self.current_file_var, "Подготовка...")
+        self._set(self.status_var, "Запуск обработки")
+        self._set(self.time_var, "Время: 00:00")
+        self._set(self.speed_var, "Скорость: -- файлов/мин")
 
     def hide_dialog(self) -> None:
-        """Скрывает диалог прогресса."""
-        if self.dialog:
-            self.dialog.destroy()
-            self.dialog = None
+        """Скрывает диалог прогресса (окна сохраняются для повторного показа)."""
+        if self._confirm is not None:
+            self._confirm.close()
+            self._confirm = None
+
+        if self.mini_window is not None and self.mini_window.winfo_exists():
+            self.mini_window.withdraw()
+
+        if self.dialog is not None and self.dialog.winfo_exists():
+            self.dialog.grab_release()
+            self.dialog.withdraw()
 
         self.is_visible = False
 
-    def _create_dialog(self) -> None:
-        """Создает диалоговое окно прогресса."""
-        # Создаем модальное окно
+    def destroy_dialog(self) -> None:
+        """Окончательно уничтожает диалог и мини-окно (при закрытии приложения)."""
+        self.hide_dialog()
+
+        if self.mini_window is not None:
+            if self.mini_window.winfo_exists():
+                self.mini_window.destroy()
+            self.mini_window = None
+            self._mini_progress = None
+
+        if self.dialog is not None:
+            if self.dialog.winfo_exists():
+                self.dialog.destroy()
+            self.dialog = None
+
+    def _create_dialog(self, modal: bool = True) -> None:
+        """
+        Создает диалоговое окно прогресса.
+
+        :param modal: Захватывать ли ввод (grab_set) на время обработки
+        """
+        _init_styles()
+
         self.dialog = tk.Toplevel(self.parent)
         self.dialog.title("Обработка OCR")
-        self.dialog.geometry("500x300")
         self.dialog.resizable(False, False)
-        self.dialog.transient(self.parent)
-        self.dialog.grab_set()
 
-        # Центрируем окно
+        # Размер и позиция задаются одним вызовом geometry до отображения окна,
+        # transient - уже после, чтобы WM не пересчитывал положение повторно
         self._center_dialog()
+        self.dialog.transient(self.parent)
 
         # Обработчик закрытия окна
         self.dialog.protocol("WM_DELETE_WINDOW", self._on_dialog_close)
@@ -108,24 +292,25 @@ class ProgressView:
         # Создаем содержимое
         self._create_dialog_content()
 
+        if modal:
+            self.dialog.grab_set()
+
     def _center_dialog(self) -> None:
         """Центрирует диалог относительно родительского окна."""
-        self.dialog.update_idletasks()
-
-        # Получаем размеры окон
-        dialog_width = self.dialog.winfo_width()
-        dialog_height = self.dialog.winfo_height()
+        # Размер диалога известен заранее - принудительный пересчет layout не нужен
+        dialog_width = self._DIALOG_WIDTH
+        dialog_height = self._DIALOG_HEIGHT
 
-        parent_x = self.parent.winfo_rootx()
-        parent_y = self.parent.winfo_rooty()
-        parent_width = self.parent.winfo_width()
-        parent_height = self.parent.winfo_height()
+        # Геометрия родителя одним запросом к Tk: "ШxВ+X+Y" (координаты могут быть отрицательными)
+        size, _, position = self.parent.winfo_geometry().partition('+')
+        parent_width, parent_height = map(int, size.split('x'))
+        parent_x, parent_y = map(int, position.split('+'))
 
         # Вычисляем позицию для центрирования
         x = parent_x + (parent_width - dialog_width) // 2
         y = parent_y + (parent_height - dialog_height) // 2
 
-        self.dialog.geometry(f"+{x}+{y}")
+        self.dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
 
     def _create_dialog_content(self) -> None:
         """Создает содержимое диалога прогресса."""
@@ -133,11 +318,10 @@ class ProgressView:
         main_frame.pack(fill=tk.BOTH, expand=True)
 
         # Заголовок
-        title_label = tk.Label(
+        title_label = ttk.Label(
             main_frame,
             text="🔍 Обработка изображений OCR",
-            font=("Arial", 14, "bold"),
-            fg="#2c3e50"
+            style="Progress.Title.TLabel"
         )
         title_label.pack(pady=(0, 20))
 
@@ -145,28 +329,28 @@ class ProgressView:
         progress_frame = tk.Frame(main_frame)
         progress_frame.pack(fill=tk.X, pady=(0, 15))
 
-        progress_label = tk.Label(
+        progress_label = ttk.Label(
             progress_frame,
             text="Общий прогресс:",
-            font=("Arial", 10, "bold")
+            style="Progress.Heading.TLabel"
         )
         progress_label.pack(anchor=tk.W)
 
         self.progress_bar = ttk.Progressbar(
             progress_frame,
             variable=self.progress_var,
-            maximum=100,
+            mode="determinate",
+            maximum=self._bar_maximum,
             length=400,
             style="TProgressbar"
         )
         self.progress_bar.pack(fill=tk.X, pady=(5, 0))
 
         # Процент выполнения
-        self.progress_percent_label = tk.Label(
+        self.progress_percent_label = ttk.Label(
             progress_frame,
-            text="0%",
-            font=("Arial", 9),
-            fg="#3498db"
+            textvariable=self.progress_percent_var,
+            style="Progress.Percent.TLabel"
         )
         self.progress_percent_label.pack(anchor=tk.E, pady=(2, 0))
 
@@ -174,18 +358,17 @@ class ProgressView:
         current_frame = tk.Frame(main_frame)
         current_frame.pack(fill=tk.X, pady=(0, 15))
 
-        current_title = tk.Label(
+        current_title = ttk.Label(
             current_frame,
             text="Текущий файл:",
-            font=("Arial", 10, "bold")
+            style="Progress.Heading.TLabel"
         )
         current_title.pack(anchor=tk.W)
 
-        self.current_file_label = tk.Label(
+        self.current_file_label = ttk.Label(
             current_frame,
             textvariable=self.current_file_var,
-            font=("Arial", 9),
-            fg="#34495e",
+            style="Progress.File.TLabel",
             wraplength=450,
             justify=tk.LEFT
         )
@@ -199,19 +382,17 @@ class ProgressView:
         left_info = tk.Frame(info_frame)
         left_info.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
-        self.status_label = tk.Label(
+        self.status_label = ttk.Label(
             left_info,
             textvariable=self.status_var,
-            font=("Arial", 9),
-            fg="#7f8c8d"
+            style="Progress.Info.TLabel"
         )
         self.status_label.pack(anchor=tk.W)
 
-        self.time_label = tk.Label(
+        self.time_label = ttk.Label(
             left_info,
             textvariable=self.time_var,
-            font=("Arial", 9),
-            fg="#7f8c8d"
+            style="Progress.Info.TLabel"
         )
         self.time_label.pack(anchor=tk.W, pady=(2, 0))
 
@@ -219,11 +400,10 @@ class ProgressView:
         right_info = tk.Frame(info_frame)
         right_info.pack(side=tk.RIGHT)
 
-        self.speed_label = tk.Label(
+        self.speed_label = ttk.Label(
             right_info,
             textvariable=self.speed_var,
-            font=("Arial", 9),
-            fg="#7f8c8d"
+            style="Progress.Info.TLabel"
         )
         self.speed_label.pack(anchor=tk.E)
 
@@ -268,79 +448,116 @@ class ProgressView:
     def update_progress(self, state: ProcessingState) -> None:
         """
         Обновляет отображение прогресса.
+        Вызывается в потоке GUI: MainView уже передает состояния через
+        run_in_gui_thread и ограничивает их частоту.
 
         :param state: Состояние обработки
         """
         if not self.is_visible or not self.dialog:
             return
 
-        # Обновляем прогресс-бар
-        self.progress_var.set(state.progress_percentage)
-
-        # Обновляем процент
-        if hasattr(self, 'progress_percent_label'):
-            self.progress_percent_label.configure(text=f"{state.progress_percentage:.1f}%")
+        self._apply_state(state)
 
-        # Обновляем текущий файл
-        if state.current_filename:
-            if state.is_running:
-                current_text = f"📄 {state.current_filename}"
-                if state.total_files > 0:
-                    current_text += f" ({state.current_file_index}/{state.total_files})"
-            else:
-                current_text = state.current_filename
+    def _apply_state(self, state: ProcessingState) -> None:
+        """
+        Применяет состояние обработки ко всем виджетам диалога.
 
-            self.current_file_var.set(current_text)
+        :param state: Состояние обработки
+        """
+        # Прогресс-бар работает в единицах файлов: шкала равна числу файлов,
+        # значение - индексу текущего файла (целое, без пересчета в проценты)
+        if state.total_files > 0:
+            if state.total_files != self._bar_maximum:
+                self._bar_maximum = state.total_files
+                self.progress_bar.configure(maximum=state.total_files)
+                if self._mini_progress is not None:
+                    self._mini_progress.configure(maximum=state.total_files)
+
+            done = state.total_files if state.progress_percentage >= 100 else state.current_file_index
+            self._set(self.progress_var, done)
 
         # Обновляем статус
         if state.is_running:
             if state.current_file_index > 0 and state.total_files > 0:
                 remaining = state.total_files - state.current_file_index
-                self.status_var.set(f"Обрабатываем... (осталось: {remaining})")
+                self._set(self.status_var, _FMT_REMAINING(remaining))
             else:
-                self.status_var.set("Обрабатываем...")
+                self._set(self.status_var, "Обрабатываем...")
         else:
             if state.progress_percentage >= 100:
-                self.status_var.set("✅ Обработка завершена")
+                self._set(self.status_var, "✅ Обработка завершена")
             else:
-                self.status_var.set("⏹️ Обработка остановлена")
+                self._set(self.status_var, "⏹️ Обработка остановлена")
+
+        if self._minimized:
+            # Мини-окно показывает только прогресс и статус - остальное применим при восстановлении
+            self._deferred_state = state
+            return
+
+        # Обновляем процент
+        self._set(self.progress_percent_var, _FMT_PERCENT(state.progress_percentage))
+
+        # Обновляем текущий файл
+        if state.current_filename:
+            if not state.is_running:
+                current_text = state.current_filename
+            elif state.total_files > 0:
+                current_text = f"📄 {state.current_filename} ({state.current_file_index}/{state.total_files})"
+            else:
+                current_text = f"📄 {state.current_filename}"
 
-        # Обновляем время (примерное, так как точное время нужно отслеживать отдельно)
-        if hasattr(state, 'elapsed_time'):
-            elapsed_minutes = int(state.elapsed_time // 60)
-            elapsed_seconds = int(state.elapsed_time % 60)
-            self.time_var.set(f"Время: {elapsed_minutes:02d}:{elapsed_seconds:02d}")
+            self._set(self.current_file_var, current_text)
+
+        # Обновляем время (форматируем только при смене целой секунды)
+        elapsed_s = int(state.elapsed_time)
+        if elapsed_s != self._last_elapsed_s:
+            self._last_elapsed_s = elapsed_s
+            self._set(self.time_var, _FMT_TIME(*divmod(elapsed_s, 60)))
 
         # Обновляем скорость
-        if hasattr(state, 'processing_speed') and state.processing_speed > 0:
+        if state.processing_speed > 0:
             speed_per_minute = state.processing_speed * 60
-            self.speed_var.set(f"Скорость: {speed_per_minute:.1f} файлов/мин")
+            self._set(self.speed_var, _FMT_SPEED(speed_per_minute))
 
-        # Обновляем состояние кнопок
-        if state.is_running:
-            self.cancel_button.configure(state=tk.NORMAL)
-            if hasattr(state, 'can_pause') and state.can_pause:
-                self.pause_button.configure(state=tk.NORMAL)
-        else:
-            self.cancel_button.configure(text="✅ Закрыть", bg="#27ae60")
+        # Обновляем состояние кнопок только при смене режима
+        cancel_mode = "running" if state.is_running else "done"
+        if cancel_mode != self._cancel_mode:
+            self._cancel_mode = cancel_mode
+            self.cancel_button.configure(**_CANCEL_BUTTON_MODES[cancel_mode])
+
+        pause_mode = tk.NORMAL if state.is_running and state.can_pause else tk.DISABLED
+        if pause_mode != self._pause_mode:
+            self._pause_mode = pause_mode
+            self.pause_button.configure(state=pause_mode)
+
+    def _set(self, var: tk.Variable, value) -> None:
+        """
+        Записывает значение в Tk переменную, только если оно изменилось.
+
+        :param var: Tk переменная
+        :param value: Новое значение
+        """
+        key = id(var)
+        if self._last_vals.get(key) == value:
+            return
 
-    def _format_time(self, seconds: float) -> str:
+        self._last_vals[key] = value
+        var.set(value)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _format_time(seconds: int) -> str:
         """
         Форматирует время в читаемый вид.
 
-        :param seconds: Время в секундах
+        :param seconds: Время в целых секундах
         :return: Отформатированная строка времени
         """
-        if seconds < 60:
-            return f"{int(seconds)}с"
-        elif seconds < 3600:
-            minutes = int(seconds // 60)
-            secs = int(seconds % 60)
-            return f"{minutes}м {secs}с"
-        else:
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
+        hours, rem = divmod(seconds, 3600)
+        minutes, secs = divmod(rem, 60)
+        if hours:
             return f"{hours}ч {minutes}м"
+        return f"{minutes}м {secs}с" if minutes else f"{secs}с"
 
     # ========================
     # Обработчики событий
@@ -360,14 +577,12 @@ class ProgressView:
             state = self.presenter.get_processing_state()
 
             if state.is_running:
-                # Подтверждение отмены
-                import tkinter.messagebox as messagebox
-                if messagebox.askyesno(
+                # Подтверждение отмены (немодальное - прогресс продолжает обновляться)
+                self._ask(
                     "Подтверждение отмены",
                     "Вы действительно хотите отменить обработку?",
-                    parent=self.dialog
-                ):
-                    self.presenter.cancel_processing()
+                    on_yes=self.presenter.cancel_processing
+                )
             else:
                 # Если обработка не идет, просто закрываем диалог
                 self.hide_dialog()
@@ -376,9 +591,14 @@ class ProgressView:
         """Обработчик кнопки скрытия в фон."""
         if self.dialog:
             self.dialog.withdraw()  # Скрываем окно, но не уничтожаем
+        self._minimized = True
 
-        # Можно добавить иконку в трей или создать маленький виджет прогресса
-        self._create_minimized_progress()
+        # Мини-окно создается один раз, далее только показывается
+        if self.mini_window is not None and self.mini_window.winfo_exists():
+            self.mini_window.deiconify()
+            self.mini_window.lift()
+        else:
+            self._create_minimized_progress()
 
     def _on_dialog_close(self) -> None:
         """Обработчик закрытия диалога через X."""
@@ -386,58 +606,74 @@ class ProgressView:
             state = self.presenter.get_processing_state()
 
             if state.is_running:
-                # Предлагаем скрыть вместо закрытия
-                import tkinter.messagebox as messagebox
-                result = messagebox.askyesnocancel(
+                # Предлагаем скрыть вместо закрытия; при "Отмена" ничего не делаем
+                self._ask(
                     "Закрытие окна",
                     "Обработка еще выполняется.\n\n"
                     "Да - Отменить обработку и закрыть\n"
                     "Нет - Скрыть окно в фон\n"
                     "Отмена - Оставить окно открытым",
-                    parent=self.dialog
+                    on_yes=self._cancel_and_close,
+                    on_no=self._on_minimize_click,
+                    with_cancel=True
                 )
-
-                if result is True:  # Да - отменить и закрыть
-                    self.presenter.cancel_processing()
-                    self.hide_dialog()
-                elif result is False:  # Нет - скрыть в фон
-                    self._on_minimize_click()
-                # При None (Отмена) ничего не делаем
             else:
                 # Обработка не идет, можно закрывать
                 self.hide_dialog()
 
+    def _cancel_and_close(self) -> None:
+        """Отменяет обработку и скрывает диалог."""
+        if self.presenter:
+            self.presenter.cancel_processing()
+        self.hide_dialog()
+
+    def _ask(self, title: str, text: str, on_yes: Callable[[], None],
+             on_no: Optional[Callable[[], None]] = None, with_cancel: bool = False) -> None:
+        """
+        Показывает немодальное подтверждение поверх диалога (не более одного одновременно).
+
+        :param title: Заголовок окна
+        :param text: Текст вопроса
+        :param on_yes: Действие при ответе "Да"
+        :param on_no: Действие при ответе "Нет"
+        :param with_cancel: Добавить кнопку "Отмена"
+        """
+        if self._confirm is not None and self._confirm.exists():
+            self._confirm.close()
+
+        self._confirm = _AsyncConfirm(self.dialog, title, text, on_yes, on_no, with_cancel)
+
     def _create_minimized_progress(self) -> None:
         """Создает минимизированный виджет прогресса."""
         # Создаем маленькое окошко с прогрессом
         mini_window = tk.Toplevel(self.parent)
         mini_window.title("OCR Progress")
-        mini_window.geometry("300x80")
         mini_window.resizable(False, False)
 
-        # Позиционируем в правом нижнем углу
-        mini_window.update_idletasks()
-        screen_width = mini_window.winfo_screenwidth()
-        screen_height = mini_window.winfo_screenheight()
+        # Позиционируем в правом нижнем углу: размер и позиция одним вызовом,
+        # размер экрана не зависит от layout, поэтому update_idletasks не нужен
+        if self._screen_size is None:
+            self._screen_size = (self.parent.winfo_screenwidth(), self.parent.winfo_screenheight())
+        screen_width, screen_height = self._screen_size
         x = screen_width - 320
         y = screen_height - 150
-        mini_window.geometry(f"+{x}+{y}")
+        mini_window.geometry(f"300x80+{x}+{y}")
 
-        # Делаем окно поверх других
-        mini_window.attributes('-topmost', True)
+        # Делаем окно поверх других после отображения (без лишнего обращения к WM до map)
+        mini_window.after_idle(lambda: mini_window.attributes('-topmost', True))
 
         # Содержимое мини-окна
         frame = tk.Frame(mini_window, padx=10, pady=10)
         frame.pack(fill=tk.BOTH, expand=True)
 
         # Мини прогресс-бар
-        mini_progress = ttk.Progressbar(
+        self._mini_progress = ttk.Progressbar(
             frame,
             variable=self.progress_var,
-            maximum=100,
+            maximum=self._bar_maximum,
             length=200
         )
-        mini_progress.pack(fill=tk.X)
+        self._mini_progress.pack(fill=tk.X)
 
         # Статус
         mini_status = tk.Label(
@@ -454,7 +690,7 @@ class ProgressView:
         show_button = tk.Button(
             mini_buttons,
             text="Показать",
-            command=lambda: self._restore_dialog(mini_window),
+            command=self._restore_dialog,
             font=("Arial", 8),
             height=1
         )
@@ -463,7 +699,7 @@ class ProgressView:
         cancel_button = tk.Button(
             mini_buttons,
             text="Отмена",
-            command=lambda: self._cancel_from_mini(mini_window),
+            command=self._cancel_from_mini,
             font=("Arial", 8),
             height=1,
             bg="#e74c3c",
@@ -474,32 +710,27 @@ class ProgressView:
         # Сохраняем ссылку на мини-окно
         self.mini_window = mini_window
 
-    def _restore_dialog(self, mini_window: tk.Toplevel) -> None:
-        """
-        Восстанавливает главный диалог прогресса.
+    def _restore_dialog(self) -> None:
+        """Восстанавливает главный диалог прогресса, скрывая мини-окно."""
+        if self.mini_window is not None:
+            self.mini_window.withdraw()
 
-        :param mini_window: Мини-окно для закрытия
-        """
-        mini_window.destroy()
-        if hasattr(self, 'mini_window'):
-            delattr(self, 'mini_window')
+        self._minimized = False
+        if self._deferred_state is not None:
+            state, self._deferred_state = self._deferred_state, None
+            self._apply_state(state)
 
         if self.dialog:
             self.dialog.deiconify()  # Показываем основное окно
             self.dialog.lift()  # Поднимаем на передний план
 
-    def _cancel_from_mini(self, mini_window: tk.Toplevel) -> None:
-        """
-        Отменяет обработку из мини-окна.
-
-        :param mini_window: Мини-окно для закрытия
-        """
+    def _cancel_from_mini(self) -> None:
+        """Отменяет обработку из мини-окна."""
         if self.presenter:
             self.presenter.cancel_processing()
 
-        mini_window.destroy()
-        if hasattr(self, 'mini_window'):
-            delattr(self, 'mini_window')
+        if self.mini_window is not None:
+            self.mini_window.withdraw()
 
     def is_dialog_visible(self) -> bool:
         """
@@ -5,8 +5,12 @@
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+from tkinter import font as tkfont
 import logging
-from typing import Optional, Dict, Any
+import queue
+import threading
+from functools import partial
+from typing import Optional, Dict, Any, Iterable, Callable
 
 # Импорт для типов
 try:
@@ -16,6 +20,52 @@ except ImportError:
     MainPresenter = None
     SettingsModel = None
 
+logger = logging.getLogger(__name__)
+
+# Константы tkinter, используемые при построении панели (глобальные имена вместо атрибутов модуля)
+X, BOTH, LEFT, RIGHT, W = tk.X, tk.BOTH, tk.LEFT, tk.RIGHT, tk.W
+NORMAL, DISABLED = tk.NORMAL, tk.DISABLED
+
+# Шрифты панели настроек: создаются один раз и разделяются всеми виджетами
+_FONT_SPECS = {
+    "normal": {"family": "Arial", "size": 9},
+    "small": {"family": "Arial", "size": 8},
+    "tiny": {"family": "Arial", "size": 7},
+    "bold": {"family": "Arial", "size": 10, "weight": "bold"},
+}
+_fonts: Dict[str, tkfont.Font] = {}
+
+# Именованные ttk стили панели настроек: (имя, шрифт, цвет текста)
+_WIDGET_STYLES = (
+    ("Settings.TLabel", "normal", None),
+    ("Settings.Small.TLabel", "small", None),
+    ("Settings.Desc.TLabel", "small", "#555555"),
+    ("Settings.Hint.TLabel", "small", "#777777"),
+    ("Settings.Mode.TRadiobutton", "bold", None),
+    ("Settings.Quick.TButton", "tiny", None),
+)
+_styles_initialized = False
+
+
+def _init_styles() -> None:
+    """Создает общие шрифты и регистрирует ttk стили панели настроек при создании первой панели."""
+    global _styles_initialized
+    if _styles_initialized:
+        return
+
+    for key, spec in _FONT_SPECS.items():
+        _fonts[key] = tkfont.Font(**spec)
+
+    style = ttk.Style()
+    for name, font_key, foreground in _WIDGET_STYLES:
+        if foreground:
+            style.configure(name, font=_fonts[font_key], foreground=foreground)
+        else:
+            style.configure(name, font=_fonts[font_key])
+    style.configure("Settings.Quick.TButton", padding=1)
+
+    _styles_initialized = True
+
 
 class SettingsView(tk.Frame):
     """
@@ -23,6 +73,18 @@ class SettingsView(tk.Frame):
     Позволяет настраивать параметры обработки для offline и online режимов.
     """
 
+    # Логгер модуля (общий для всех экземпляров)
+    logger = logger
+
+    # Период проверки завершения теста соединения (мс)
+    _TEST_POLL_MS = 50
+
+    # Режимы OCR в mode_var (IntVar) и их строковые имена в модели настроек
+    MODE_OFFLINE = 0
+    MODE_ONLINE = 1
+    _MODE_NAMES = ("offline", "online")
+    _MODE_INDEX = {"offline": MODE_OFFLINE, "online": MODE_ONLINE}
+
     def __init__(self, parent: tk.Widget):
         """
         Инициализация представления настроек.
@@ -30,13 +92,12 @@ class SettingsView(tk.Frame):
         :param parent: Родительский виджет
         """
         super().__init__(parent)
-        self.logger = logging.getLogger(__name__)
 
         # Presenter будет установлен позже
         self.presenter: Optional[MainPresenter] = None
 
         # Переменные для виджетов
-        self.mode_var = tk.StringVar(value="offline")
+        self.mode_var = tk.IntVar(value=self.MODE_OFFLINE)
         self.sort_var = tk.StringVar(value="natural")
         self.output_file_var = tk.StringVar(value="result.txt")
 
@@ -52,18 +113,39 @@ class SettingsView(tk.Frame):
         self.metadata_var = tk.BooleanVar(value=True)
 
         # Виджеты
-        self.canvas: Optional[tk.Canvas] = None
-        self.scrollbar: Optional[ttk.Scrollbar] = None
-        self.scrollable_frame: Optional[tk.Frame] = None
-        self.mode_frame: Optional[tk.LabelFrame] = None
-        self.offline_frame: Optional[tk.LabelFrame] = None
-        self.online_frame: Optional[tk.LabelFrame] = None
-        self.output_frame: Optional[tk.LabelFrame] = None
-        self.sort_frame: Optional[tk.LabelFrame] = None
+        self.notebook: Optional[ttk.Notebook] = None
+        self.general_tab: Optional[ttk.Frame] = None
+        self.offline_tab: Optional[ttk.Frame] = None
+        self.online_tab: Optional[ttk.Frame] = None
+        self.output_tab: Optional[ttk.Frame] = None
+        self.extras_tab: Optional[ttk.Frame] = None
+
+        # Последние записанные списки значений Combobox (по имени виджета)
+        self._combo_values: Dict[str, tuple] = {}
+
+        # Отложенные (debounce) вызовы обработчиков по ключу
+        self._after_ids: Dict[str, str] = {}
+        self._pending_handlers: Dict[str, Callable[[], None]] = {}
+
+        # Поля ввода по ключу отложенного вызова: пока поле в фокусе, значение
+        # передается presenter только по <FocusOut>/<Return>
+        self._edit_widgets: Dict[str, tk.Widget] = {}
+
+        # Истина во время заполнения виджетов из модели - обработчики изменений игнорируются
+        self._suppress_events = False
+
+        # Секции режимов строятся лениво - при первом выборе соответствующего режима
+        self._offline_built = False
+        self._online_built = False
+        self.mode_frame: Optional[ttk.LabelFrame] = None
+        self.offline_frame: Optional[ttk.LabelFrame] = None
+        self.online_frame: Optional[ttk.LabelFrame] = None
+        self.test_button: Optional[tk.Button] = None
+        self.output_frame: Optional[ttk.LabelFrame] = None
+        self.sort_frame: Optional[ttk.LabelFrame] = None
 
         # Создаем GUI
         self._create_gui()
-        self._setup_bindings()
 
     def set_presenter(self, presenter) -> None:
         """
@@ -75,130 +157,58 @@ class SettingsView(tk.Frame):
         self.update_from_model()
 
     def _create_gui(self) -> None:
-        """Создает интерфейс панели настроек с исправленным scrollbar."""
-        # ИСПРАВЛЕНИЕ: Создаем контейнер для canvas и scrollbar
-        main_container = tk.Frame(self)
-        main_container.pack(fill=tk.BOTH, expand=True)
-
-        # Создаем Canvas для прокручиваемого содержимого
-        self.canvas = tk.Canvas(
-            main_container,
-            highlightthickness=0,
-            bg="#f8f9fa"  # Светлый фон для лучшей видимости
-        )
-
-        # КРИТИЧНО: Создаем Scrollbar с принудительной видимостью
-        self.scrollbar = ttk.Scrollbar(
-            main_container,
-            orient="vertical",
-            command=self.canvas.yview
-        )
+        """Создает интерфейс панели настроек в виде вкладок."""
+        _init_styles()
 
-        # Создаем прокручиваемый фрейм
-        self.scrollable_frame = tk.Frame(self.canvas, bg="#f8f9fa")
+        # Вкладки вместо прокручиваемого Canvas: Tk раскладывает только видимую вкладку,
+        # и при изменении размера не нужно пересчитывать scrollregion
+        self.notebook = ttk.Notebook(self)
 
-        # Конфигурируем прокрутку
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self._on_frame_configure()
-        )
-
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
-
-        # ИСПРАВЛЕНИЕ: Правильное размещение элементов с использованием grid
-        self.canvas.grid(row=0, column=0, sticky="nsew")
-        self.scrollbar.grid(row=0, column=1, sticky="ns")
-
-        # Настраиваем веса grid для корректного расширения
-        main_container.grid_rowconfigure(0, weight=1)
-        main_container.grid_columnconfigure(0, weight=1)
+        self.general_tab = ttk.Frame(self.notebook)
+        self.offline_tab = ttk.Frame(self.notebook)
+        self.online_tab = ttk.Frame(self.notebook)
+        self.output_tab = ttk.Frame(self.notebook)
+        self.extras_tab = ttk.Frame(self.notebook)
 
         # Создаем разделы настроек
-        self._create_mode_section(self.scrollable_frame)
-        self._create_sort_section(self.scrollable_frame)
-        self._create_offline_section(self.scrollable_frame)
-        self._create_online_section(self.scrollable_frame)
-        self._create_output_section(self.scrollable_frame)
-        self._create_additional_section(self.scrollable_frame)
-
-        # ДОПОЛНИТЕЛЬНО: Принудительно обновляем scrollregion после создания контента
-        self.after(100, self._force_scrollbar_update)
-
-        # Привязываем прокрутку колесиком мыши
-        self._bind_mousewheel()
-
-    def _on_frame_configure(self) -> None:
-        """Обработчик изменения размера прокручиваемого фрейма."""
-        # Обновляем scrollregion для включения всего содержимого
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-
-        # ИСПРАВЛЕНИЕ: Принудительно показываем scrollbar если содержимое больше видимой области
-        self._update_scrollbar_visibility()
-
-    def _force_scrollbar_update(self) -> None:
-        """Принудительно обновляет состояние scrollbar."""
-        try:
-            self.canvas.update_idletasks()
-            self.scrollable_frame.update_idletasks()
-
-            # Получаем размеры
-            canvas_height = self.canvas.winfo_height()
-            content_height = self.scrollable_frame.winfo_reqheight()
-
-            # Обновляем scrollregion
-            self.canvas.configure(scrollregion=(0, 0, 0, content_height))
-
-            # Логируем для отладки
-            self.logger.debug(f"Canvas height: {canvas_height}, Content height: {content_height}")
-
-            # Если содержимое больше видимой области, scrollbar должен быть активен
-            if content_height > canvas_height:
-                self.logger.debug("Scrollbar should be visible")
-
-        except Exception as e:
-            self.logger.error(f"Ошибка обновления scrollbar: {e}")
-
-    def _update_scrollbar_visibility(self) -> None:
-        """Обновляет видимость scrollbar в зависимости от содержимого."""
-        try:
-            canvas_height = self.canvas.winfo_height()
-            content_height = self.scrollable_frame.winfo_reqheight()
-
-            # Если содержимое больше видимой области, показываем scrollbar
-            if content_height > canvas_height and canvas_height > 1:
-                # Scrollbar уже видим, просто обновляем его состояние
-                self.scrollbar.set(*self.canvas.yview())
-
-        except Exception as e:
-            self.logger.error(f"Ошибка обновления видимости scrollbar: {e}")
-
-    def _bind_mousewheel(self) -> None:
-        """Привязывает прокрутку колесиком мыши к области настроек."""
-        def _on_mousewheel(event):
-            # Прокручиваем только если scrollbar активен
-            try:
-                self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-            except:
-                pass
-
-        def bind_mousewheel_recursive(widget):
-            """Рекурсивно привязывает mousewheel ко всем дочерним виджетам."""
-            try:
-                widget.bind("<MouseWheel>", _on_mousewheel)
-                # Для macOS
-                widget.bind("<Button-4>", lambda e: _on_mousewheel(type('event', (), {'delta': 120})()))
-                widget.bind("<Button-5>", lambda e: _on_mousewheel(type('event', (), {'delta': -120})()))
-
-                for child in widget.winfo_children():
-                    bind_mousewheel_recursive(child)
-            except:
-                pass
+        self._create_mode_section(self.general_tab)
+        self._create_sort_section(self.general_tab)
+        self._ensure_mode_section(self.mode_var.get())
+        self._create_output_section(self.output_tab)
+        self._create_additional_section(self.extras_tab)
+
+        # Вкладки добавляются и размещаются после заполнения: пока контейнер не управляется
+        # геометрией, упаковка дочерних виджетов не запускает пересчет layout всего дерева
+        self.notebook.add(self.general_tab, text="Режим")
+        self.notebook.add(self.offline_tab, text="Offline")
+        self.notebook.add(self.online_tab, text="Online")
+        self.notebook.add(self.output_tab, text="Вывод")
+        self.notebook.add(self.extras_tab, text="Ещё")
+
+        self.notebook.pack(fill=BOTH, expand=True)
+
+    def _ensure_mode_section(self, mode: int) -> None:
+        """
+        Создает секцию настроек режима, если она еще не построена.
 
-        # Привязываем к canvas и всем дочерним элементам
-        bind_mousewheel_recursive(self.scrollable_frame)
-        self.canvas.bind("<MouseWheel>", _on_mousewheel)
-        self.bind("<MouseWheel>", _on_mousewheel)
+        :param mode: Режим OCR (MODE_OFFLINE или MODE_ONLINE)
+        """
+        # Заполняются только списки только что созданной секции
+        if mode == self.MODE_OFFLINE:
+            if self._offline_built:
+                return
+            self._create_offline_section(self.offline_tab)
+            self._offline_built = True
+            if self.presenter:
+                self._update_language_values()
+                self._update_psm_values(self.presenter.get_settings())
+        else:
+            if self._online_built:
+                return
+            self._create_online_section(self.online_tab)
+            self._online_built = True
+            if self.presenter:
+                self._update_prompt_values()
 
     def _create_mode_section(self, parent: tk.Widget) -> None:
         """
@@ -206,56 +216,54 @@ class SettingsView(tk.Frame):
 
         :param parent: Родительский виджет
         """
-        self.mode_frame = tk.LabelFrame(parent, text="🔧 Режим OCR", padx=10, pady=10)
-        self.mode_frame.pack(fill=tk.X, padx=5, pady=5)
+        self.mode_frame = ttk.LabelFrame(parent, text="🔧 Режим OCR", padding=10)
+        self.mode_frame.pack(fill=X, padx=5, pady=5)
 
         # Описание режимов
-        desc_label = tk.Label(
+        desc_label = ttk.Label(
             self.mode_frame,
             text="Выберите способ распознавания текста:",
-            font=("Arial", 9)
+            style="Settings.TLabel"
         )
-        desc_label.pack(anchor=tk.W, pady=(0, 10))
+        desc_label.pack(anchor=W, pady=(0, 10))
 
         # Offline режим
-        offline_radio = tk.Radiobutton(
+        offline_radio = ttk.Radiobutton(
             self.mode_frame,
             text="📴 Offline (Tesseract OCR)",
             variable=self.mode_var,
-            value="offline",
-            font=("Arial", 10, "bold"),
+            value=self.MODE_OFFLINE,
+            style="Settings.Mode.TRadiobutton",
             command=self._on_mode_change
         )
-        offline_radio.pack(anchor=tk.W, pady=2)
+        offline_radio.pack(anchor=W, pady=2)
 
-        offline_desc = tk.Label(
+        offline_desc = ttk.Label(
             self.mode_frame,
             text="• Быстрая обработка без интернета\n• Поддержка множества языков\n• Базовое качество распознавания",
-            font=("Arial", 8),
-            fg="#555555",
-            justify=tk.LEFT
+            style="Settings.Desc.TLabel",
+            justify=LEFT
         )
-        offline_desc.pack(anchor=tk.W, padx=20, pady=(0, 10))
+        offline_desc.pack(anchor=W, padx=20, pady=(0, 10))
 
         # Online режим
-        online_radio = tk.Radiobutton(
+        online_radio = ttk.Radiobutton(
             self.mode_frame,
             text="🌐 Online (ИИ модели)",
             variable=self.mode_var,
-            value="online",
-            font=("Arial", 10, "bold"),
+            value=self.MODE_ONLINE,
+            style="Settings.Mode.TRadiobutton",
             command=self._on_mode_change
         )
-        online_radio.pack(anchor=tk.W, pady=2)
+        online_radio.pack(anchor=W, pady=2)
 
-        online_desc = tk.Label(
+        online_desc = ttk.Label(
             self.mode_frame,
             text="• Высокое качество распознавания\n• Понимание контекста и структуры\n• Требует подключение к интернету",
-            font=("Arial", 8),
-            fg="#555555",
-            justify=tk.LEFT
+            style="Settings.Desc.TLabel",
+            justify=LEFT
         )
-        online_desc.pack(anchor=tk.W, padx=20)
+        online_desc.pack(anchor=W, padx=20)
 
     def _create_sort_section(self, parent: tk.Widget) -> None:
         """
@@ -263,15 +271,15 @@ class SettingsView(tk.Frame):
 
         :param parent: Родительский виджет
         """
-        self.sort_frame = tk.LabelFrame(parent, text="🔢 Сортировка файлов", padx=10, pady=10)
-        self.sort_frame.pack(fill=tk.X, padx=5, pady=5)
+        self.sort_frame = ttk.LabelFrame(parent, text="🔢 Сортировка файлов", padding=10)
+        self.sort_frame.pack(fill=X, padx=5, pady=5)
 
-        sort_label = tk.Label(
+        sort_label = ttk.Label(
             self.sort_frame,
             text="Порядок обработки файлов:",
-            font=("Arial", 9)
+            style="Settings.TLabel"
         )
-        sort_label.pack(anchor=tk.W, pady=(0, 5))
+        sort_label.pack(anchor=W, pady=(0, 5))
 
         # Combobox для выбора метода сортировки
         self.sort_combo = ttk.Combobox(
@@ -280,7 +288,8 @@ class SettingsView(tk.Frame):
             state="readonly",
             width=30
         )
-        self.sort_combo.pack(fill=tk.X, pady=5)
+        self.sort_combo.pack(fill=X, pady=5)
+        self.sort_combo.bind("<<ComboboxSelected>>", self._on_sort_change)
 
     def _create_offline_section(self, parent: tk.Widget) -> None:
         """
@@ -288,14 +297,14 @@ class SettingsView(tk.Frame):
 
         :param parent: Родительский виджет
         """
-        self.offline_frame = tk.LabelFrame(parent, text="📴 Настройки Offline OCR", padx=10, pady=10)
-        self.offline_frame.pack(fill=tk.X, padx=5, pady=5)
+        self.offline_frame = ttk.LabelFrame(parent, text="📴 Настройки Offline OCR", padding=10)
+        self.offline_frame.pack(fill=X, padx=5, pady=5)
 
         # Выбор языка
-        lang_frame = tk.Frame(self.offline_frame)
-        lang_frame.pack(fill=tk.X, pady=5)
+        lang_frame = ttk.Frame(self.offline_frame)
+        lang_frame.pack(fill=X, pady=5)
 
-        tk.Label(lang_frame, text="Язык:", font=("Arial", 9)).pack(side=tk.LEFT)
+        ttk.Label(lang_frame, text="Язык:", style="Settings.TLabel").pack(side=LEFT)
 
         self.language_combo = ttk.Combobox(
             lang_frame,
@@ -303,13 +312,14 @@ class SettingsView(tk.Frame):
             state="readonly",
             width=15
         )
-        self.language_combo.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=(10, 0))
+        self.language_combo.pack(side=RIGHT, fill=X, expand=True, padx=(10, 0))
+        self.language_combo.bind("<<ComboboxSelected>>", self._on_language_change)
 
         # PSM режим
-        psm_frame = tk.Frame(self.offline_frame)
-        psm_frame.pack(fill=tk.X, pady=5)
+        psm_frame = ttk.Frame(self.offline_frame)
+        psm_frame.pack(fill=X, pady=5)
 
-        tk.Label(psm_frame, text="PSM режим:", font=("Arial", 9)).pack(side=tk.LEFT)
+        ttk.Label(psm_frame, text="PSM режим:", style="Settings.TLabel").pack(side=LEFT)
 
         self.psm_combo = ttk.Combobox(
             psm_frame,
@@ -317,17 +327,17 @@ class SettingsView(tk.Frame):
             state="readonly",
             width=15
         )
-        self.psm_combo.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=(10, 0))
+        self.psm_combo.pack(side=RIGHT, fill=X, expand=True, padx=(10, 0))
+        self.psm_combo.bind("<<ComboboxSelected>>", self._on_psm_change)
 
         # Информация о PSM
-        psm_info = tk.Label(
+        psm_info = ttk.Label(
             self.offline_frame,
             text="PSM (Page Segmentation Mode) - алгоритм анализа структуры страницы",
-            font=("Arial", 8),
-            fg="#777777",
+            style="Settings.Hint.TLabel",
             wraplength=250
         )
-        psm_info.pack(anchor=tk.W, pady=(5, 0))
+        psm_info.pack(anchor=W, pady=(5, 0))
 
     def _create_online_section(self, parent: tk.Widget) -> None:
         """
@@ -335,14 +345,14 @@ class SettingsView(tk.Frame):
 
         :param parent: Родительский виджет
         """
-        self.online_frame = tk.LabelFrame(parent, text="🌐 Настройки Online OCR", padx=10, pady=10)
-        self.online_frame.pack(fill=tk.X, padx=5, pady=5)
+        self.online_frame = ttk.LabelFrame(parent, text="🌐 Настройки Online OCR", padding=10)
+        self.online_frame.pack(fill=X, padx=5, pady=5)
 
         # Выбор промпта
-        prompt_frame = tk.Frame(self.online_frame)
-        prompt_frame.pack(fill=tk.X, pady=5)
+        prompt_frame = ttk.Frame(self.online_frame)
+        prompt_frame.pack(fill=X, pady=5)
 
-        tk.Label(prompt_frame, text="Тип OCR:", font=("Arial", 9)).pack(side=tk.LEFT)
+        ttk.Label(prompt_frame, text="Тип OCR:", style="Settings.TLabel").pack(side=LEFT)
 
         self.prompt_combo = ttk.Combobox(
             prompt_frame,
@@ -350,35 +360,42 @@ class SettingsView(tk.Frame):
             state="readonly",
             width=15
         )
-        self.prompt_combo.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=(10, 0))
+        self.prompt_combo.pack(side=RIGHT, fill=X, expand=True, padx=(10, 0))
+        self.prompt_combo.bind("<<ComboboxSelected>>", self._on_prompt_change)
 
         # Количество потоков
-        threads_frame = tk.Frame(self.online_frame)
-        threads_frame.pack(fill=tk.X, pady=5)
+        threads_frame = ttk.Frame(self.online_frame)
+        threads_frame.pack(fill=X, pady=5)
 
-        tk.Label(threads_frame, text="Потоков:", font=("Arial", 9)).pack(side=tk.LEFT)
+        ttk.Label(threads_frame, text="Потоков:", style="Settings.TLabel").pack(side=LEFT)
 
-        self.threads_spinbox = tk.Spinbox(
+        self.threads_spinbox = ttk.Spinbox(
             threads_frame,
             from_=1,
             to=20,
             textvariable=self.threads_var,
             width=10
         )
-        self.threads_spinbox.pack(side=tk.RIGHT, padx=(10, 0))
+        self.threads_spinbox.pack(side=RIGHT, padx=(10, 0))
+        self.threads_var.trace_add("write", lambda *_: self._on_var_write("threads", self._on_threads_change))
+        self.threads_spinbox.bind("<FocusOut>", lambda e: self.flush_pending("threads"))
+        self.threads_spinbox.bind("<Return>", lambda e: self.flush_pending("threads"))
+        # Стрелки spinbox меняют значение после генерации события - фиксируем его в idle
+        for sequence in ("<<Increment>>", "<<Decrement>>"):
+            self.threads_spinbox.bind(sequence, lambda e: self.after_idle(self.flush_pending, "threads"))
+        self._edit_widgets["threads"] = self.threads_spinbox
 
         # Информация о потоках
-        threads_info = tk.Label(
+        threads_info = ttk.Label(
             self.online_frame,
             text="Больше потоков = быстрее обработка, но больше нагрузка на API",
-            font=("Arial", 8),
-            fg="#777777",
+            style="Settings.Hint.TLabel",
             wraplength=250
         )
-        threads_info.pack(anchor=tk.W, pady=(5, 0))
+        threads_info.pack(anchor=W, pady=(5, 0))
 
         # Кнопка тестирования соединения
-        test_button = tk.Button(
+        self.test_button = tk.Button(
             self.online_frame,
             text="🔗 Тест соединения",
             command=self._on_test_connection,
@@ -386,7 +403,7 @@ class SettingsView(tk.Frame):
             fg="white",
             pady=3
         )
-        test_button.pack(fill=tk.X, pady=(10, 0))
+        self.test_button.pack(fill=X, pady=(10, 0))
 
     def _create_output_section(self, parent: tk.Widget) -> None:
         """
@@ -394,45 +411,48 @@ class SettingsView(tk.Frame):
 
         :param parent: Родительский виджет
         """
-        self.output_frame = tk.LabelFrame(parent, text="💾 Выходной файл", padx=10, pady=10)
-        self.output_frame.pack(fill=tk.X, padx=5, pady=5)
+        self.output_frame = ttk.LabelFrame(parent, text="💾 Выходной файл", padding=10)
+        self.output_frame.pack(fill=X, padx=5, pady=5)
 
         # Поле для пути к файлу
-        file_frame = tk.Frame(self.output_frame)
-        file_frame.pack(fill=tk.X, pady=5)
+        file_frame = ttk.Frame(self.output_frame)
+        file_frame.pack(fill=X, pady=5)
 
-        self.output_entry = tk.Entry(
+        self.output_entry = ttk.Entry(
             file_frame,
             textvariable=self.output_file_var,
-            font=("Arial", 9)
+            font=_fonts["normal"]
         )
-        self.output_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.output_entry.pack(side=LEFT, fill=X, expand=True)
+        self.output_file_var.trace_add("write", lambda *_: self._on_var_write("output", self._on_output_file_change))
+        self.output_entry.bind("<FocusOut>", lambda e: self.flush_pending("output"))
+        self.output_entry.bind("<Return>", lambda e: self.flush_pending("output"))
+        self._edit_widgets["output"] = self.output_entry
 
-        browse_button = tk.Button(
+        browse_button = ttk.Button(
             file_frame,
             text="📁",
             command=self._on_browse_output_file,
             width=3
         )
-        browse_button.pack(side=tk.RIGHT, padx=(5, 0))
+        browse_button.pack(side=RIGHT, padx=(5, 0))
 
         # Быстрые кнопки для типичных имен
-        quick_frame = tk.Frame(self.output_frame)
-        quick_frame.pack(fill=tk.X, pady=(5, 0))
+        quick_frame = ttk.Frame(self.output_frame)
+        quick_frame.pack(fill=X, pady=(5, 0))
 
-        quick_label = tk.Label(quick_frame, text="Быстрый выбор:", font=("Arial", 8))
-        quick_label.pack(side=tk.LEFT)
+        quick_label = ttk.Label(quick_frame, text="Быстрый выбор:", style="Settings.Small.TLabel")
+        quick_label.pack(side=LEFT)
 
         quick_names = ["result.txt", "ocr_output.txt", "extracted_text.txt"]
         for name in quick_names:
-            btn = tk.Button(
+            btn = ttk.Button(
                 quick_frame,
                 text=name,
-                command=lambda n=name: self.output_file_var.set(n),
-                font=("Arial", 7),
-                pady=1
+                command=partial(self._set_output, name),
+                style="Settings.Quick.TButton"
             )
-            btn.pack(side=tk.RIGHT, padx=1)
+            btn.pack(side=RIGHT, padx=1)
 
     def _create_additional_section(self, parent: tk.Widget) -> None:
         """
@@ -440,30 +460,29 @@ class SettingsView(tk.Frame):
 
         :param parent: Родительский виджет
         """
-        additional_frame = tk.LabelFrame(parent, text="➕ Дополнительно", padx=10, pady=10)
-        additional_frame.pack(fill=tk.X, padx=5, pady=5)
+        additional_frame = ttk.LabelFrame(parent, text="➕ Дополнительно", padding=10)
+        additional_frame.pack(fill=X, padx=5, pady=5)
 
         # Включение метаданных
-        metadata_check = tk.Checkbutton(
+        metadata_check = ttk.Checkbutton(
             additional_frame,
             text="Включать метаданные в результат",
             variable=self.metadata_var,
             command=self._on_metadata_change
         )
-        metadata_check.pack(anchor=tk.W, pady=2)
+        metadata_check.pack(anchor=W, pady=2)
 
-        metadata_desc = tk.Label(
+        metadata_desc = ttk.Label(
             additional_frame,
             text="Добавляет информацию о файлах, времени обработки и статистику",
-            font=("Arial", 8),
-            fg="#777777",
+            style="Settings.Hint.TLabel",
             wraplength=250
         )
-        metadata_desc.pack(anchor=tk.W, padx=20, pady=(0, 10))
+        metadata_desc.pack(anchor=W, padx=20, pady=(0, 10))
 
         # Кнопки управления настройками
-        buttons_frame = tk.Frame(additional_frame)
-        buttons_frame.pack(fill=tk.X, pady=(10, 0))
+        buttons_frame = ttk.Frame(additional_frame)
+        buttons_frame.pack(fill=X, pady=(10, 0))
 
         save_button = tk.Button(
             buttons_frame,
@@ -473,7 +492,7 @@ class SettingsView(tk.Frame):
             fg="white",
             pady=3
         )
-        save_button.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 2))
+        save_button.pack(side=LEFT, fill=X, expand=True, padx=(0, 2))
 
         reset_button = tk.Button(
             buttons_frame,
@@ -483,118 +502,158 @@ class SettingsView(tk.Frame):
             fg="white",
             pady=3
         )
-        reset_button.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=(2, 0))
-
-        # ДОПОЛНИТЕЛЬНО: Добавляем немного контента для тестирования scrollbar
-        for i in range(3):
-            test_frame = tk.LabelFrame(parent, text=f"🧪 Тестовая секция {i+1}", padx=10, pady=10)
-            test_frame.pack(fill=tk.X, padx=5, pady=5)
-
-            test_label = tk.Label(
-                test_frame,
-                text="Эта секция добавлена для демонстрации работы scrollbar.\n"
-                     "Когда содержимое превышает высоту окна, должна появиться прокрутка.",
-                font=("Arial", 8),
-                fg="#666666",
-                wraplength=250,
-                justify=tk.LEFT
-            )
-            test_label.pack(anchor=tk.W, pady=5)
-
-    def _setup_bindings(self) -> None:
-        """Настраивает обработчики событий."""
-        # Обработчики изменений в виджетах
-        self.sort_combo.bind("<<ComboboxSelected>>", self._on_sort_change)
-        self.language_combo.bind("<<ComboboxSelected>>", self._on_language_change)
-        self.psm_combo.bind("<<ComboboxSelected>>", self._on_psm_change)
-        self.prompt_combo.bind("<<ComboboxSelected>>", self._on_prompt_change)
-        self.threads_spinbox.bind("<FocusOut>", self._on_threads_change)
-        self.output_entry.bind("<FocusOut>", self._on_output_file_change)
+        reset_button.pack(side=RIGHT, fill=X, expand=True, padx=(2, 0))
 
-        # Привязываем обновление scrollbar к изменению размера
-        self.bind("<Configure>", lambda e: self.after_idle(self._force_scrollbar_update))
+    def update_from_model(self, sections: Iterable[str] = ("all",)) -> None:
+        """
+        Обновляет виджеты на основе данных из модели.
 
-    def update_from_model(self) -> None:
-        """Обновляет виджеты на основе данных из модели."""
+        :param sections: Что обновлять: "all" - значения и списки, "visibility" - только видимость секций
+        """
         if not self.presenter:
             return
 
-        settings = self.presenter.get_settings()
+        # Программная запись значений не должна возвращаться в presenter через обработчики
+        self._suppress_events = True
+        try:
+            self._apply_model(sections)
+        finally:
+            self._suppress_events = False
 
-        # Обновляем основные настройки
-        self.mode_var.set(settings.ocr_mode)
-        self.sort_var.set(settings.sort_method)
-        self.output_file_var.set(settings.output_file)
-        self.metadata_var.set(settings.include_metadata)
+    def _apply_model(self, sections: Iterable[str]) -> None:
+        """
+        Переносит значения модели в виджеты (обработчики изменений при этом отключены).
 
-        # Обновляем offline настройки
-        self.language_var.set(settings.offline_settings.language)
-        self.psm_var.set(settings.offline_settings.psm_mode)
+        :param sections: Какие части панели обновлять
+        """
+        if "all" in sections:
+            settings = self.presenter.get_settings()
 
-        # Обновляем online настройки
-        self.prompt_var.set(settings.online_settings.prompt_name)
-        self.threads_var.set(settings.online_settings.max_threads)
+            # Обновляем основные настройки
+            self.mode_var.set(self._MODE_INDEX.get(settings.ocr_mode, self.MODE_OFFLINE))
+            self.sort_var.set(settings.sort_method)
+            self._set_if_changed(self.output_file_var, settings.output_file)
+            self.metadata_var.set(settings.include_metadata)
 
-        # Обновляем списки доступных опций
-        self._update_combo_options()
+            # Обновляем offline настройки
+            self.language_var.set(settings.offline_settings.language)
+            self.psm_var.set(settings.offline_settings.psm_mode)
+
+            # Обновляем online настройки
+            self.prompt_var.set(settings.online_settings.prompt_name)
+            self._set_if_changed(self.threads_var, settings.online_settings.max_threads)
+
+            # Обновляем списки доступных опций
+            self._update_combo_options(settings)
 
         # Обновляем видимость секций
         self._update_sections_visibility()
 
-        # Принудительно обновляем scrollbar после обновления модели
-        self.after(200, self._force_scrollbar_update)
+    @staticmethod
+    def _set_if_changed(var: tk.Variable, value) -> None:
+        """
+        Записывает значение в переменную, только если оно отличается (не сбрасывает курсор в поле ввода).
 
-    def _update_combo_options(self) -> None:
-        """Обновляет опции в выпадающих списках."""
+        :param var: Tk переменная
+        :param value: Новое значение
+        """
+        try:
+            if var.get() == value:
+                return
+        except tk.TclError:
+            pass  # В поле сейчас некорректное значение - перезаписываем
+        var.set(value)
+
+    def _update_combo_options(self, settings=None) -> None:
+        """
+        Обновляет опции во всех построенных выпадающих списках.
+
+        :param settings: Модель настроек, уже полученная вызывающим (None - запросить у presenter)
+        """
         if not self.presenter:
             return
 
-        settings = self.presenter.get_settings()
+        if settings is None:
+            settings = self.presenter.get_settings()
+
+        self._update_sort_values(settings)
+
+        if self._offline_built:
+            self._update_language_values()
+            self._update_psm_values(settings)
 
-        # Обновляем методы сортировки
-        sort_options = [method['name'] for method in settings.available_sort_methods]
-        sort_values = [method['key'] for method in settings.available_sort_methods]
+        if self._online_built:
+            self._update_prompt_values()
 
-        self.sort_combo['values'] = sort_options
+    def _update_sort_values(self, settings) -> None:
+        """
+        Обновляет список методов сортировки и выбранный метод.
+
+        :param settings: Модель настроек
+        """
+        sort_methods = settings.available_sort_methods
+        sort_options = [method['name'] for method in sort_methods]
+        sort_index = {method['key']: i for i, method in enumerate(sort_methods)}
+
+        self._set_combo_values(self.sort_combo, sort_options)
         # Устанавливаем отображаемое значение
-        current_method = settings.sort_method
-        for i, key in enumerate(sort_values):
-            if key == current_method:
-                self.sort_combo.current(i)
-                break
+        index = sort_index.get(settings.sort_method)
+        if index is not None:
+            self.sort_combo.current(index)
 
-        # Обновляем языки
+    def _update_language_values(self) -> None:
+        """Обновляет список языков offline OCR."""
         languages = self.presenter.get_available_languages()
-        self.language_combo['values'] = languages
+        self._set_combo_values(self.language_combo, languages)
 
-        # Обновляем PSM режимы
-        psm_options = [f"{mode['name']}" for mode in settings.available_psm_modes]
-        self.psm_combo['values'] = psm_options
+    def _update_psm_values(self, settings) -> None:
+        """
+        Обновляет список PSM режимов и выбранный режим.
+
+        :param settings: Модель настроек
+        """
+        psm_modes = settings.available_psm_modes
+        psm_options = [f"{mode['name']}" for mode in psm_modes]
+        self._set_combo_values(self.psm_combo, psm_options)
 
         # Устанавливаем текущий PSM
-        current_psm = settings.offline_settings.psm_mode
-        for i, mode in enumerate(settings.available_psm_modes):
-            if mode['value'] == current_psm:
-                self.psm_combo.current(i)
-                break
+        psm_index = {mode['value']: i for i, mode in enumerate(psm_modes)}
+        index = psm_index.get(settings.offline_settings.psm_mode)
+        if index is not None:
+            self.psm_combo.current(index)
 
-        # Обновляем промпты
+    def _update_prompt_values(self) -> None:
+        """Обновляет список промптов online OCR."""
         prompts = self.presenter.get_available_prompts()
-        self.prompt_combo['values'] = prompts
+        self._set_combo_values(self.prompt_combo, prompts)
+
+    def _set_combo_values(self, combo: ttk.Combobox, values) -> None:
+        """
+        Записывает список значений в Combobox, только если он изменился.
+
+        :param combo: Выпадающий список
+        :param values: Новые значения
+        """
+        values = tuple(values)
+        key = str(combo)
+        if self._combo_values.get(key) == values:
+            return
+
+        self._combo_values[key] = values
+        combo['values'] = values
 
     def _update_sections_visibility(self) -> None:
         """Обновляет видимость секций в зависимости от режима."""
         mode = self.mode_var.get()
+        self._ensure_mode_section(mode)
 
-        if mode == "offline":
-            self.offline_frame.pack(fill=tk.X, padx=5, pady=5)
-            self.online_frame.pack_forget()
+        # Вкладка неактивного режима скрывается, а не удаляется
+        if mode == self.MODE_OFFLINE:
+            self.notebook.tab(self.offline_tab, state="normal")
+            self.notebook.tab(self.online_tab, state="hidden")
         else:
-            self.online_frame.pack(fill=tk.X, padx=5, pady=5)
-            self.offline_frame.pack_forget()
-
-        # Обновляем scrollbar после изменения видимости
-        self.after(100, self._force_scrollbar_update)
+            self.notebook.tab(self.online_tab, state="normal")
+            self.notebook.tab(self.offline_tab, state="hidden")
 
     # ========================
     # Обработчики событий
@@ -602,14 +661,15 @@ class SettingsView(tk.Frame):
 
     def _on_mode_change(self) -> None:
         """Обработчик изменения режима OCR."""
-        if self.presenter:
-            mode = self.mode_var.get()
+        if self.presenter and not self._suppress_events:
+            # Presenter работает со строковыми именами режимов
+            mode = self._MODE_NAMES[self.mode_var.get()]
             self.presenter.set_ocr_mode(mode)
-            self._update_sections_visibility()
+            self.update_from_model(sections=("visibility",))
 
     def _on_sort_change(self, event=None) -> None:
         """Обработчик изменения метода сортировки."""
-        if self.presenter:
+        if self.presenter and not self._suppress_events:
             settings = self.presenter.get_settings()
             selected_index = self.sort_combo.current()
 
@@ -619,13 +679,13 @@ class SettingsView(tk.Frame):
 
     def _on_language_change(self, event=None) -> None:
         """Обработчик изменения языка OCR."""
-        if self.presenter:
+        if self.presenter and not self._suppress_events:
             language = self.language_var.get()
             self.presenter.update_offline_settings(language=language)
 
     def _on_psm_change(self, event=None) -> None:
         """Обработчик изменения PSM режима."""
-        if self.presenter:
+        if self.presenter and not self._suppress_events:
             settings = self.presenter.get_settings()
             selected_index = self.psm_combo.current()
 
@@ -635,13 +695,13 @@ class SettingsView(tk.Frame):
 
     def _on_prompt_change(self, event=None) -> None:
         """Обработчик изменения промпта."""
-        if self.presenter:
+        if self.presenter and not self._suppress_events:
             prompt = self.prompt_var.get()
             self.presenter.update_online_settings(prompt_name=prompt)
 
     def _on_threads_change(self, event=None) -> None:
         """Обработчик изменения количества потоков."""
-        if self.presenter:
+        if self.presenter and not self._suppress_events:
             try:
                 threads = self.threads_var.get()
                 if 1 <= threads <= 20:
@@ -651,14 +711,91 @@ class SettingsView(tk.Frame):
 
     def _on_output_file_change(self, event=None) -> None:
         """Обработчик изменения выходного файла."""
-        if self.presenter:
+        if self.presenter and not self._suppress_events:
             output_file = self.output_file_var.get().strip()
             if output_file:
                 self.presenter.set_output_file(output_file)
 
+    def _set_output(self, name: str) -> None:
+        """
+        Устанавливает выходной файл из быстрого выбора (presenter уведомляется через trace переменной).
+
+        :param name: Имя выходного файла
+        """
+        self.output_file_var.set(name)
+
+    def _on_var_write(self, key: str, handler) -> None:
+        """
+        Обработчик записи в Tk переменную: откладывает вызов handler до паузы во вводе,
+        а при вводе в поле с фокусом - до завершения редактирования (<FocusOut>/<Return>).
+
+        :param key: Ключ отложенного вызова
+        :param handler: Обработчик изменения
+        """
+        if self._suppress_events:
+            return
+
+        if self._is_editing(key):
+            # Частичный ввод не отправляется в presenter: иначе модель, автосохранение
+            # и обратная запись в поле срабатывают на каждой паузе
+            after_id = self._after_ids.pop(key, None)
+            if after_id is not None:
+                self.after_cancel(after_id)
+            self._pending_handlers[key] = handler
+            return
+
+        self._debounce(key, handler)
+
+    def _is_editing(self, key: str) -> bool:
+        """
+        Проверяет, находится ли поле ввода с данным ключом в фокусе.
+
+        :param key: Ключ отложенного вызова
+        :return: True, если пользователь редактирует поле
+        """
+        widget = self._edit_widgets.get(key)
+        if widget is None:
+            return False
+        try:
+            return self.focus_get() is widget
+        except (KeyError, tk.TclError):
+            # focus_get падает, если фокус во всплывающем списке Combobox
+            return False
+
+    def _debounce(self, key: str, handler, ms: int = 200) -> None:
+        """
+        Планирует handler через ms миллисекунд, отменяя ранее запланированный вызов с тем же ключом.
+
+        :param key: Ключ отложенного вызова
+        :param handler: Вызываемая функция
+        :param ms: Задержка в миллисекундах
+        """
+        after_id = self._after_ids.pop(key, None)
+        if after_id is not None:
+            self.after_cancel(after_id)
+
+        self._pending_handlers[key] = handler
+        self._after_ids[key] = self.after(ms, self.flush_pending, key)
+
+    def flush_pending(self, *keys: str) -> None:
+        """
+        Немедленно выполняет отложенные обработчики (все или с указанными ключами).
+
+        :param keys: Ключи отложенных вызовов; без аргументов - все
+        """
+        for key in keys or tuple(self._pending_handlers):
+            handler = self._pending_handlers.pop(key, None)
+            if handler is None:
+                continue
+
+            after_id = self._after_ids.pop(key, None)
+            if after_id is not None:
+                self.after_cancel(after_id)
+            handler()
+
     def _on_metadata_change(self) -> None:
         """Обработчик изменения настройки метаданных."""
-        if self.presenter:
+        if self.presenter and not self._suppress_events:
             include_metadata = self.metadata_var.get()
             settings = self.presenter.get_settings()
             settings.include_metadata = include_metadata
@@ -675,43 +812,85 @@ class SettingsView(tk.Frame):
         )
 
         if filename:
+            # Presenter уведомляется через trace переменной - сразу, без ожидания debounce
             self.output_file_var.set(filename)
-            if self.presenter:
-                self.presenter.set_output_file(filename)
+            self.flush_pending("output")
 
     def _on_test_connection(self) -> None:
         """Обработчик тестирования соединения с OCR сервисом."""
         if not self.presenter:
             return
 
-        # Показываем индикатор загрузки
-        test_button = None
-        for child in self.online_frame.winfo_children():
-            if isinstance(child, tk.Button) and "Тест" in child.cget("text"):
-                test_button = child
-                break
+        # Показываем индикатор загрузки (кнопка есть, только если online секция построена)
+        test_button = self.test_button
 
+        original_text = None
         if test_button:
             original_text = test_button.cget("text")
-            test_button.configure(text="⏳ Тестирование...", state=tk.DISABLED)
-            self.update()
+            test_button.configure(text="⏳ Тестирование...", state=DISABLED)
+
+        # Тест выполняется в фоне - поток GUI возвращается в цикл событий и перерисовывает кнопку сам.
+        # Результат передается через очередь, которую опрашивает поток GUI
+        results: "queue.Queue[tuple]" = queue.Queue(maxsize=1)
+        threading.Thread(
+            target=self._run_connection_test,
+            args=(results,),
+            daemon=True
+        ).start()
+        self.after(self._TEST_POLL_MS, self._poll_connection_test, results, test_button, original_text)
+
+    def _run_connection_test(self, results: "queue.Queue[tuple]") -> None:
+        """
+        Выполняет тест соединения в фоновом потоке (Tk здесь не вызывается).
 
+        :param results: Очередь для результата (success, error)
+        """
+        error = None
         try:
-            # Выполняем тест
             success = self.presenter.test_ocr_connection()
+        except Exception as e:
+            success = False
+            error = e
 
-            if success:
-                messagebox.showinfo("Тест соединения", "✅ Соединение с OCR сервисом работает!")
-            else:
-                messagebox.showwarning("Тест соединения", "⚠️ Проблемы с подключением к OCR сервису")
+        results.put((success, error))
 
-        except Exception as e:
-            messagebox.showerror("Ошибка теста", f"❌ Ошибка при тестировании:\n{e}")
+    def _poll_connection_test(self, results: "queue.Queue[tuple]",
+                              test_button: Optional[tk.Button], original_text: Optional[str]) -> None:
+        """
+        Проверяет, завершился ли тест соединения (в потоке GUI).
 
-        finally:
-            # Восстанавливаем кнопку
-            if test_button:
-                test_button.configure(text=original_text, state=tk.NORMAL)
+        :param results: Очередь с результатом теста
+        :param test_button: Кнопка теста
+        :param original_text: Исходный текст кнопки
+        """
+        try:
+            success, error = results.get_nowait()
+        except queue.Empty:
+            self.after(self._TEST_POLL_MS, self._poll_connection_test, results, test_button, original_text)
+            return
+
+        self._on_connection_tested(test_button, original_text, success, error)
+
+    def _on_connection_tested(self, test_button: Optional[tk.Button], original_text: Optional[str],
+                              success: bool, error: Optional[Exception]) -> None:
+        """
+        Показывает результат теста соединения (в потоке GUI).
+
+        :param test_button: Кнопка теста
+        :param original_text: Исходный текст кнопки
+        :param success: Результат теста
+        :param error: Исключение, если тест завершился ошибкой
+        """
+        # Восстанавливаем кнопку
+        if test_button:
+            test_button.configure(text=original_text, state=NORMAL)
+
+        if error is not None:
+            messagebox.showerror("Ошибка теста", f"❌ Ошибка при тестировании:\n{error}")
+        elif success:
+            messagebox.showinfo("Тест соединения", "✅ Соединение с OCR сервисом работает!")
+        else:
+            messagebox.showwarning("Тест соединения", "⚠️ Проблемы с подключением к OCR сервису")
 
     def _on_save_settings(self) -> None:
         """Обработчик сохранения настроек."""
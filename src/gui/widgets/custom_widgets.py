@@ -3,11 +3,21 @@
 Содержит переиспользуемые компоненты с улучшенным дизайном.
 """
 
+import math
 import tkinter as tk
+from collections import deque
 from tkinter import ttk
-import threading
 import time
-from typing import Optional, Callable, Any
+from types import MappingProxyType
+from typing import Optional, Callable, Any, Dict
+
+# (cos, sin) углов дуги 0..90 градусов с шагом 10 для закругленных углов
+_ARC = tuple((math.cos(math.radians(a)), math.sin(math.radians(a))) for a in range(0, 91, 10))
+assert len(_ARC) == 10
+
+# Размеры экрана (запрашиваются у Tk один раз при первом показе подсказки)
+_SCREEN_W: Optional[int] = None
+_SCREEN_H: Optional[int] = None
 
 
 class AnimatedProgressBar(tk.Frame):
@@ -15,6 +25,30 @@ class AnimatedProgressBar(tk.Frame):
     Анимированный прогресс-бар с эффектами и дополнительной информацией.
     """
 
+    # Палитра прогресс-бара
+    _COLORS = MappingProxyType({
+        'bg': '#ecf0f1',
+        'fill': '#3498db',
+        'text': '#2c3e50',
+        'success': '#27ae60',
+        'warning': '#f39c12',
+        'error': '#e74c3c'
+    })
+
+    # Стиль прогресс-бара -> ключ цвета в палитре
+    _STYLE_COLOR_KEYS = MappingProxyType({
+        'normal': 'fill',
+        'success': 'success',
+        'warning': 'warning',
+        'error': 'error'
+    })
+
+    # Ключ цвета процента для каждого целого значения прогресса 0..100
+    _PERCENT_COLOR_KEYS = tuple(
+        'success' if p >= 100 else 'warning' if 50 <= p < 75 else 'fill'
+        for p in range(101)
+    )
+
     def __init__(self, parent: tk.Widget, **kwargs):
         """
         Инициализация анимированного прогресс-бара.
@@ -25,21 +59,25 @@ class AnimatedProgressBar(tk.Frame):
         super().__init__(parent, **kwargs)
 
         # Переменные
-        self.progress_var = tk.DoubleVar()
         self.max_value = 100
         self.current_value = 0
         self.is_animating = False
-        self.animation_speed = 50  # миллисекунды
-
-        # Цвета
-        self.colors = {
-            'bg': '#ecf0f1',
-            'fill': '#3498db',
-            'text': '#2c3e50',
-            'success': '#27ae60',
-            'warning': '#f39c12',
-            'error': '#e74c3c'
-        }
+        self.animation_speed = 16  # миллисекунды между шагами анимации (~60 Гц)
+        self.animation_duration = 0.3  # длительность анимации в секундах
+        self.animation_job = None
+
+        # Параметры текущей анимации (один самоперепланирующийся after)
+        self._anim_start = 0.0
+        self._anim_target = 0.0
+        self._anim_t0 = 0.0
+
+        # Последние примененные значения надписей (повторный configure пропускается)
+        self._last_percent_text = None
+        self._last_info_text = None
+        self._last_percent_fg = None
+
+        # Цвета (общая неизменяемая палитра класса)
+        self.colors = self._COLORS
 
         self._create_widgets()
 
@@ -48,7 +86,6 @@ class AnimatedProgressBar(tk.Frame):
         # Основной прогресс-бар
         self.progressbar = ttk.Progressbar(
             self,
-            variable=self.progress_var,
             maximum=self.max_value,
             length=300,
             style="Custom.Horizontal.TProgressbar"
@@ -86,45 +123,71 @@ class AnimatedProgressBar(tk.Frame):
         """
         target_value = max(0, min(value, self.max_value))
 
-        if not self.is_animating:
+        if self.is_animating:
+            # Анимация уже идет - продолжаем ее от текущего значения к новой цели
+            self._anim_start = self.current_value
+            self._anim_target = target_value
+            self._anim_t0 = time.perf_counter()
+        else:
             self._animate_to_value(target_value)
 
-        # Обновляем текст
-        self.percent_label.configure(text=f"{target_value:.1f}%")
-        self.info_label.configure(text=info_text)
-
-        # Изменяем цвет в зависимости от прогресса
-        if target_value >= 100:
-            color = self.colors['success']
-        elif target_value >= 75:
-            color = self.colors['fill']
-        elif target_value >= 50:
-            color = self.colors['warning']
-        else:
-            color = self.colors['fill']
+        # Цвет в зависимости от прогресса
+        color = self.colors[self._PERCENT_COLOR_KEYS[min(int(target_value), 100)]]
+
+        # Обновляем текст и цвет процента одним вызовом, передавая только изменившееся
+        changes = {}
+        percent_text = f"{target_value:.1f}%"
+        if percent_text != self._last_percent_text:
+            self._last_percent_text = percent_text
+            changes['text'] = percent_text
+        if color != self._last_percent_fg:
+            self._last_percent_fg = color
+            changes['fg'] = color
+        if changes:
+            self.percent_label.configure(**changes)
+
+        if info_text != self._last_info_text:
+            self._last_info_text = info_text
+            self.info_label.configure(text=info_text)
 
-        self.percent_label.configure(fg=color)
+    def _set_percent_fg(self, color: str) -> None:
+        """
+        Устанавливает цвет процента, только если он изменился.
+
+        :param color: Цвет текста
+        """
+        if color != self._last_percent_fg:
+            self._last_percent_fg = color
+            self.percent_label.configure(fg=color)
 
     def _animate_to_value(self, target_value: float) -> None:
         """
         Анимирует прогресс до целевого значения.
 
+        Анимация целиком выполняется в главном цикле Tk через after();
+        из рабочих потоков прогресс следует передавать через run_in_gui_thread.
+
         :param target_value: Целевое значение
         """
         self.is_animating = True
+        self._anim_start = self.current_value
+        self._anim_target = target_value
+        self._anim_t0 = time.perf_counter()
+        self._tick()
+
+    def _tick(self) -> None:
+        """Выполняет один шаг анимации и планирует следующий в потоке GUI."""
+        # Значение вычисляется по прошедшему времени, а не по номеру шага
+        t = (time.perf_counter() - self._anim_t0) / self.animation_duration
+        if t >= 1:
+            self._update_value(self._anim_target)
+            self.is_animating = False
+            self.animation_job = None
+            return
 
-        def animate():
-            start_value = self.current_value
-            steps = 20
-            step_size = (target_value - start_value) / steps
-
-            for i in range(steps + 1):
-                new_value = start_value + (step_size * i)
-                self.after(self.animation_speed * i, lambda v=new_value: self._update_value(v))
-
-            self.after(self.animation_speed * (steps + 1), lambda: setattr(self, 'is_animating', False))
+        self._update_value(self._anim_start + (self._anim_target - self._anim_start) * t)
 
-        threading.Thread(target=animate, daemon=True).start()
+        self.animation_job = self.after(self.animation_speed, self._tick)
 
     def _update_value(self, value: float) -> None:
         """
@@ -133,7 +196,7 @@ class AnimatedProgressBar(tk.Frame):
         :param value: Новое значение
         """
         self.current_value = value
-        self.progress_var.set(value)
+        self.progressbar['value'] = value
 
     def set_style(self, style_name: str) -> None:
         """
@@ -141,15 +204,8 @@ class AnimatedProgressBar(tk.Frame):
 
         :param style_name: Название стиля ('normal', 'success', 'warning', 'error')
         """
-        style_colors = {
-            'normal': self.colors['fill'],
-            'success': self.colors['success'],
-            'warning': self.colors['warning'],
-            'error': self.colors['error']
-        }
-
-        color = style_colors.get(style_name, self.colors['fill'])
-        self.percent_label.configure(fg=color)
+        color = self.colors[self._STYLE_COLOR_KEYS.get(style_name, 'fill')]
+        self._set_percent_fg(color)
 
 
 class StatusBar(tk.Frame):
@@ -157,6 +213,30 @@ class StatusBar(tk.Frame):
     Улучшенная статусная строка с поддержкой иконок и анимации.
     """
 
+    # Минимальный интервал анимации загрузки (мс)
+    _BUSY_INTERVAL_MS = 100
+
+    # Кадры анимации загрузки
+    _ANIM_CHARS = ("⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏")
+
+    # Цвета для разных типов статуса
+    _STATUS_COLORS = MappingProxyType({
+        'normal': '#2c3e50',
+        'info': '#3498db',
+        'warning': '#f39c12',
+        'error': '#e74c3c',
+        'success': '#27ae60'
+    })
+
+    # Иконки для разных типов
+    _STATUS_ICONS = MappingProxyType({
+        'normal': '',
+        'info': 'ℹ️',
+        'warning': '⚠️',
+        'error': '❌',
+        'success': '✅'
+    })
+
     def __init__(self, parent: tk.Widget, **kwargs):
         """
         Инициализация статусной строки.
@@ -171,10 +251,22 @@ class StatusBar(tk.Frame):
         self.status_var.set("Готов к работе")
 
         # Анимация статуса
-        self.animation_chars = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+        self.animation_chars = self._ANIM_CHARS
         self.animation_index = 0
         self.is_busy = False
         self.animation_job = None
+        # Опоздания последних тиков анимации (мс) для подстройки интервала под реальную частоту кадров
+        self._tick_history = deque(maxlen=20)
+        self._next_tick_at: Optional[float] = None
+
+        # Последние примененные значения (повторная запись пропускается)
+        self._last_status = None
+        self._last_status_fg = None
+        self._last_info = None
+
+        # Статус, ожидающий записи в ближайший цикл простоя Tk
+        self._pending_status: Optional[tuple] = None
+        self._flush_scheduled = False
 
         self._create_widgets()
 
@@ -219,31 +311,33 @@ class StatusBar(tk.Frame):
         # Останавливаем анимацию
         self.stop_busy_animation()
 
-        # Цвета для разных типов статуса
-        colors = {
-            'normal': '#2c3e50',
-            'info': '#3498db',
-            'warning': '#f39c12',
-            'error': '#e74c3c',
-            'success': '#27ae60'
-        }
-
-        # Иконки для разных типов
-        icons = {
-            'normal': '',
-            'info': 'ℹ️',
-            'warning': '⚠️',
-            'error': '❌',
-            'success': '✅'
-        }
-
-        color = colors.get(status_type, colors['normal'])
-        icon = icons.get(status_type, '')
+        color = self._STATUS_COLORS.get(status_type, self._STATUS_COLORS['normal'])
+        icon = self._STATUS_ICONS.get(status_type, '')
 
         full_message = f"{icon} {message}" if icon else message
 
-        self.status_var.set(full_message)
-        self.status_label.configure(fg=color)
+        # Частые вызовы объединяются в одну запись за цикл простоя Tk
+        self._pending_status = (full_message, color)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush_status)
+
+    def _flush_status(self) -> None:
+        """Применяет последний установленный статус."""
+        self._flush_scheduled = False
+        pending, self._pending_status = self._pending_status, None
+        # Запущенная после set_status анимация сама управляет текстом
+        if pending is None or self.is_busy:
+            return
+
+        full_message, color = pending
+        if full_message != self._last_status:
+            self._last_status = full_message
+            self.status_var.set(full_message)
+
+        if color != self._last_status_fg:
+            self._last_status_fg = color
+            self.status_label.configure(fg=color)
 
     def set_info(self, info_text: str) -> None:
         """
@@ -251,7 +345,9 @@ class StatusBar(tk.Frame):
 
         :param info_text: Информационный текст
         """
-        self.info_label.configure(text=info_text)
+        if info_text != self._last_info:
+            self._last_info = info_text
+            self.info_label.configure(text=info_text)
 
     def start_busy_animation(self, message: str = "Обработка") -> None:
         """
@@ -261,6 +357,11 @@ class StatusBar(tk.Frame):
         """
         self.is_busy = True
         self.base_message = message
+        # Повторный запуск не должен порождать второй цикл анимации
+        if self.animation_job:
+            self.after_cancel(self.animation_job)
+        self._tick_history.clear()
+        self._next_tick_at = None
         self._animate_busy()
 
     def stop_busy_animation(self) -> None:
@@ -272,18 +373,34 @@ class StatusBar(tk.Frame):
 
     def _animate_busy(self) -> None:
         """Анимирует индикатор загрузки."""
+        self.animation_job = None
         if not self.is_busy:
             return
 
-        # Обновляем символ анимации
-        char = self.animation_chars[self.animation_index]
-        self.status_var.set(f"{char} {self.base_message}...")
+        now = time.perf_counter()
+        history = self._tick_history
+        if self._next_tick_at is not None:
+            history.append(max(0.0, (now - self._next_tick_at) * 1000))
+
+        # Невидимый виджет Tk все равно не перерисует - пропускаем запись
+        if self.winfo_viewable():
+            char = self.animation_chars[self.animation_index]
+            self.status_var.set(f"{char} {self.base_message}...")
+            self._last_status = None  # Текст изменен анимацией, кэш сообщения недействителен
 
         # Переходим к следующему символу
         self.animation_index = (self.animation_index + 1) % len(self.animation_chars)
 
+        # Если тики приходят реже запланированного, расширяем интервал,
+        # чтобы не копить необслуженные обратные вызовы
+        interval = self._BUSY_INTERVAL_MS
+        if history:
+            mean_late_ms = sum(history) / len(history)
+            interval += int(mean_late_ms * 1.1)
+
         # Планируем следующее обновление
-        self.animation_job = self.after(100, self._animate_busy)
+        self._next_tick_at = now + interval / 1000
+        self.animation_job = self.after(interval, self._animate_busy)
 
 
 class ToolTip:
@@ -303,10 +420,19 @@ class ToolTip:
         self.text = text
         self.delay = delay
 
+        # Окно подсказки создается при первом показе и далее только скрывается
         self.tooltip_window = None
+        self._label = None
+        self._label_text: Optional[str] = None
+        self._visible = False
         self.show_job = None
         self.hide_job = None
 
+        # Движения мыши объединяются в одно перемещение за цикл простоя Tk
+        self._motion_pending = False
+        self._last_motion_xy = (0, 0)
+        self._applied_xy: Optional[tuple] = None
+
         # Привязываем события
         self.widget.bind("<Enter>", self._on_enter)
         self.widget.bind("<Leave>", self._on_leave)
@@ -324,7 +450,7 @@ class ToolTip:
     def _on_motion(self, event) -> None:
         """Обработчик движения мыши."""
         # Обновляем позицию если подсказка показана
-        if self.tooltip_window:
+        if self._visible:
             self._update_position(event)
 
     def _schedule_show(self) -> None:
@@ -338,18 +464,15 @@ class ToolTip:
             self.widget.after_cancel(self.show_job)
             self.show_job = None
 
-    def _show_tooltip(self) -> None:
-        """Показывает всплывающую подсказку."""
-        if self.tooltip_window:
-            return
-
-        # Создаем окно подсказки
+    def _create_window(self) -> None:
+        """Создает скрытое окно подсказки."""
         self.tooltip_window = tk.Toplevel(self.widget)
+        self.tooltip_window.wm_withdraw()
         self.tooltip_window.wm_overrideredirect(True)
         self.tooltip_window.wm_attributes("-topmost", True)
 
         # Создаем содержимое
-        label = tk.Label(
+        self._label = tk.Label(
             self.tooltip_window,
             text=self.text,
             background="#ffffcc",
@@ -362,13 +485,30 @@ class ToolTip:
             padx=5,
             pady=3
         )
-        label.pack()
+        self._label.pack()
+        self._label_text = self.text
 
-        # Позиционируем подсказку
+    def _show_tooltip(self) -> None:
+        """Показывает всплывающую подсказку."""
+        self.show_job = None
+        if self._visible:
+            return
+
+        if self.tooltip_window is None:
+            self._create_window()
+        elif self._label_text != self.text:
+            self._label_text = self.text
+            self._label.configure(text=self.text)
+
+        # Позиционируем и показываем подсказку
         self._position_tooltip()
+        self.tooltip_window.deiconify()
+        self._visible = True
 
     def _position_tooltip(self) -> None:
         """Позиционирует всплывающую подсказку."""
+        global _SCREEN_W, _SCREEN_H
+
         if not self.tooltip_window:
             return
 
@@ -380,11 +520,15 @@ class ToolTip:
         self.tooltip_window.update_idletasks()
 
         # Проверяем, не выходит ли подсказка за границы экрана
-        screen_width = self.tooltip_window.winfo_screenwidth()
-        screen_height = self.tooltip_window.winfo_screenheight()
+        if _SCREEN_W is None:
+            _SCREEN_W = self.tooltip_window.winfo_screenwidth()
+            _SCREEN_H = self.tooltip_window.winfo_screenheight()
+        screen_width = _SCREEN_W
+        screen_height = _SCREEN_H
 
-        tooltip_width = self.tooltip_window.winfo_width()
-        tooltip_height = self.tooltip_window.winfo_height()
+        # Скрытое окно не имеет фактических размеров - берем запрошенные
+        tooltip_width = self.tooltip_window.winfo_reqwidth()
+        tooltip_height = self.tooltip_window.winfo_reqheight()
 
         # Корректируем позицию если нужно
         if x + tooltip_width > screen_width:
@@ -393,24 +537,41 @@ class ToolTip:
         if y + tooltip_height > screen_height:
             y = self.widget.winfo_rooty() - tooltip_height - 5
 
+        self._applied_xy = (x, y)
         self.tooltip_window.geometry(f"+{x}+{y}")
 
     def _update_position(self, event) -> None:
         """
-        Обновляет позицию подсказки при движении мыши.
+        Запоминает позицию мыши и планирует перемещение подсказки.
 
         :param event: Событие движения мыши
         """
-        if self.tooltip_window:
-            x = event.x_root + 10
-            y = event.y_root + 10
-            self.tooltip_window.geometry(f"+{x}+{y}")
+        self._last_motion_xy = (event.x_root + 10, event.y_root + 10)
+        if not self._motion_pending:
+            self._motion_pending = True
+            self.widget.after_idle(self._apply_motion)
+
+    def _apply_motion(self) -> None:
+        """Перемещает подсказку в последнюю запомненную позицию."""
+        self._motion_pending = False
+        if not self._visible:
+            return
+
+        x, y = self._last_motion_xy
+        # Сдвиги меньше 2 пикселей не стоят обращения к оконному менеджеру
+        if self._applied_xy is not None:
+            ax, ay = self._applied_xy
+            if abs(x - ax) < 2 and abs(y - ay) < 2:
+                return
+
+        self._applied_xy = (x, y)
+        self.tooltip_window.geometry(f"+{x}+{y}")
 
     def _hide_tooltip(self) -> None:
         """Скрывает всплывающую подсказку."""
-        if self.tooltip_window:
-            self.tooltip_window.destroy()
-            self.tooltip_window = None
+        if self._visible:
+            self.tooltip_window.withdraw()
+            self._visible = False
 
     def update_text(self, new_text: str) -> None:
         """
@@ -418,12 +579,15 @@ class ToolTip:
 
         :param new_text: Новый текст подсказки
         """
+        if new_text == self.text:
+            return
         self.text = new_text
 
-        # Если подсказка сейчас показана, обновляем ее
-        if self.tooltip_window:
-            self._hide_tooltip()
-            self._show_tooltip()
+        # Если подсказка сейчас показана, обновляем ее на месте
+        if self._visible:
+            self._label_text = new_text
+            self._label.configure(text=new_text)
+            self._position_tooltip()
 
 
 class RoundedButton(tk.Canvas):
@@ -431,6 +595,21 @@ class RoundedButton(tk.Canvas):
     Кнопка с закругленными углами и эффектами наведения.
     """
 
+    # Точки закругленного прямоугольника по (ширина, высота, радиус)
+    _POLY_CACHE: Dict[tuple, tuple] = {}
+
+    # Цвета по умолчанию (переопределяются одноименными kwargs)
+    _COLORS = MappingProxyType({
+        'normal_bg': '#3498db',
+        'normal_fg': '#ffffff',
+        'hover_bg': '#2980b9',
+        'hover_fg': '#ffffff',
+        'pressed_bg': '#21618c',
+        'pressed_fg': '#ffffff',
+        'disabled_bg': '#bdc3c7',
+        'disabled_fg': '#7f8c8d'
+    })
+
     def __init__(self, parent: tk.Widget, text: str = "", command: Optional[Callable] = None,
                  width: int = 100, height: int = 30, radius: int = 10, **kwargs):
         """
@@ -444,6 +623,9 @@ class RoundedButton(tk.Canvas):
         :param radius: Радиус закругления
         :param kwargs: Дополнительные параметры
         """
+        # Цвета кнопки не являются параметрами canvas - отделяем их
+        color_overrides = {key: kwargs.pop(key) for key in self._COLORS.keys() & kwargs.keys()}
+
         super().__init__(parent, width=width, height=height, highlightthickness=0, **kwargs)
 
         self.text = text
@@ -451,33 +633,28 @@ class RoundedButton(tk.Canvas):
         self.radius = radius
         self.is_pressed = False
         self.is_hovered = False
+        # Состояние хранится в Python, чтобы не запрашивать его у Tcl на каждое событие мыши
+        self._is_disabled = str(kwargs.get('state', '')) == 'disabled'
+
+        # Элементы canvas (создаются при первой отрисовке)
+        self._poly_id: Optional[int] = None
+        self._text_id: Optional[int] = None
+        self._drawn_size: Optional[tuple] = None
+        # Текущий размер canvas (обновляется обработчиком <Configure>)
+        self._w, self._h = int(width), int(height)
+        # Запрошена ли перерисовка на ближайший цикл простоя Tk
+        self._redraw_pending = False
 
-        # Цвета
-        self.colors = {
-            'normal_bg': '#3498db',
-            'normal_fg': '#ffffff',
-            'hover_bg': '#2980b9',
-            'hover_fg': '#ffffff',
-            'pressed_bg': '#21618c',
-            'pressed_fg': '#ffffff',
-            'disabled_bg': '#bdc3c7',
-            'disabled_fg': '#7f8c8d'
-        }
-
-        # Обновляем цвета из kwargs
-        for key, value in kwargs.items():
-            if key in self.colors:
-                self.colors[key] = value
+        # Цвета (общая палитра класса, копия только при переопределении)
+        self.colors = {**self._COLORS, **color_overrides} if color_overrides else self._COLORS
 
         self._draw_button()
         self._bind_events()
 
     def _draw_button(self) -> None:
-        """Рисует кнопку на canvas."""
-        self.delete("all")
-
+        """Рисует кнопку на canvas (элементы создаются один раз, далее меняются их цвета)."""
         # Определяем цвета в зависимости от состояния
-        if str(self.cget('state')) == 'disabled':
+        if self._is_disabled:
             bg_color = self.colors['disabled_bg']
             fg_color = self.colors['disabled_fg']
         elif self.is_pressed:
@@ -490,85 +667,121 @@ class RoundedButton(tk.Canvas):
             bg_color = self.colors['normal_bg']
             fg_color = self.colors['normal_fg']
 
-        # Получаем размеры
-        width = self.winfo_width() or self.cget('width')
-        height = self.winfo_height() or self.cget('height')
+        width, height = self._w, self._h
+
+        if self._poly_id is None:
+            # Первая отрисовка: создаем многоугольник и текст
+            self._poly_id = self._draw_rounded_rectangle(2, 2, width-2, height-2, self.radius, bg_color)
+            self._text_id = self.create_text(
+                width//2, height//2,
+                text=self.text,
+                fill=fg_color,
+                font=("Arial", 10, "bold"),
+                anchor=tk.CENTER
+            )
+            self._drawn_size = (width, height)
+            return
 
-        # Рисуем закругленный прямоугольник
-        self._draw_rounded_rectangle(2, 2, width-2, height-2, self.radius, bg_color)
+        if (width, height) != self._drawn_size:
+            # Размер изменился - переносим координаты существующих элементов
+            self._drawn_size = (width, height)
+            if self.radius > 0:
+                self.coords(self._poly_id, *self._translated_points(2, 2, width-2, height-2, self.radius))
+            else:
+                self.coords(self._poly_id, 2, 2, width-2, height-2)
+            self.coords(self._text_id, width//2, height//2)
+
+        self.itemconfigure(self._poly_id, fill=bg_color)
+        self.itemconfigure(self._text_id, text=self.text, fill=fg_color)
+
+    def _request_redraw(self) -> None:
+        """Планирует перерисовку, объединяя несколько изменений состояния в одну."""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._do_redraw)
+
+    def _do_redraw(self) -> None:
+        """Выполняет запланированную перерисовку."""
+        self._redraw_pending = False
+        self._draw_button()
 
-        # Добавляем текст
-        self.create_text(
-            width//2, height//2,
-            text=self.text,
-            fill=fg_color,
-            font=("Arial", 10, "bold"),
-            anchor=tk.CENTER
-        )
+    def _on_configure(self, event) -> None:
+        """Обработчик изменения размера canvas."""
+        self._w, self._h = event.width, event.height
+        if (self._w, self._h) != self._drawn_size:
+            self._request_redraw()
 
-    def _draw_rounded_rectangle(self, x1: int, y1: int, x2: int, y2: int,
-                               radius: int, fill_color: str) -> None:
+    def _translated_points(self, x1: int, y1: int, x2: int, y2: int, radius: int):
         """
-        Рисует закругленный прямоугольник.
+        Возвращает точки закругленного прямоугольника в координатах canvas.
 
         :param x1, y1, x2, y2: Координаты прямоугольника
         :param radius: Радиус закругления
-        :param fill_color: Цвет заливки
+        :return: Плоская последовательность координат
         """
-        # Создаем точки для закругленного прямоугольника
-        points = []
+        points = self._rounded_rect_points(x2 - x1, y2 - y1, radius)
+        if x1 or y1:
+            points = [c + (x1 if i % 2 == 0 else y1) for i, c in enumerate(points)]
+        return points
 
-        # Верхняя сторона
-        points.extend([x1 + radius, y1])
-        points.extend([x2 - radius, y1])
+    @classmethod
+    def _rounded_rect_points(cls, width: int, height: int, radius: int) -> tuple:
+        """
+        Возвращает точки закругленного прямоугольника с углом в (0, 0) (кэшируются по размеру).
+
+        :param width: Ширина прямоугольника
+        :param height: Высота прямоугольника
+        :param radius: Радиус закругления
+        :return: Плоский кортеж координат x, y по часовой стрелке
+        """
+        key = (width, height, radius)
+        points = cls._POLY_CACHE.get(key)
+        if points is not None:
+            return points
+
+        r = radius
+        right, bottom = width - r, height - r
+        coords = [r, 0, right, 0]
 
         # Верхний правый угол
-        for i in range(0, 91, 10):
-            angle = i * 3.14159 / 180
-            px = x2 - radius + radius * (1 - tk.cos(angle))
-            py = y1 + radius - radius * tk.sin(angle)
-            points.extend([px, py])
-
-        # Правая сторона
-        points.extend([x2, y1 + radius])
-        points.extend([x2, y2 - radius])
-
-        # Нижний правый угол
-        for i in range(0, 91, 10):
-            angle = i * 3.14159 / 180
-            px = x2 - radius + radius * tk.sin(angle)
-            py = y2 - radius + radius * (1 - tk.cos(angle))
-            points.extend([px, py])
-
-        # Нижняя сторона
-        points.extend([x2 - radius, y2])
-        points.extend([x1 + radius, y2])
+        for cos_a, sin_a in _ARC:
+            coords.extend((right + r * sin_a, r - r * cos_a))
+
+        # Правая и нижняя сторона, нижний правый угол
+        coords.extend((width, r, width, bottom))
+        for cos_a, sin_a in _ARC:
+            coords.extend((right + r * cos_a, bottom + r * sin_a))
 
         # Нижний левый угол
-        for i in range(0, 91, 10):
-            angle = i * 3.14159 / 180
-            px = x1 + radius - radius * (1 - tk.cos(angle))
-            py = y2 - radius + radius * tk.sin(angle)
-            points.extend([px, py])
-
-        # Левая сторона
-        points.extend([x1, y2 - radius])
-        points.extend([x1, y1 + radius])
-
-        # Верхний левый угол
-        for i in range(0, 91, 10):
-            angle = i * 3.14159 / 180
-            px = x1 + radius - radius * tk.sin(angle)
-            py = y1 + radius - radius * (1 - tk.cos(angle))
-            points.extend([px, py])
-
-        # Рисуем многоугольник
-        if points:
-            try:
-                self.create_polygon(points, fill=fill_color, outline="", smooth=True)
-            except:
-                # Fallback к обычному прямоугольнику
-                self.create_rectangle(x1, y1, x2, y2, fill=fill_color, outline="")
+        coords.extend((right, height, r, height))
+        for cos_a, sin_a in _ARC:
+            coords.extend((r - r * sin_a, bottom + r * cos_a))
+
+        # Левая сторона, верхний левый угол
+        coords.extend((0, bottom, 0, r))
+        for cos_a, sin_a in _ARC:
+            coords.extend((r - r * cos_a, r - r * sin_a))
+
+        points = tuple(coords)
+        cls._POLY_CACHE[key] = points
+        return points
+
+    def _draw_rounded_rectangle(self, x1: int, y1: int, x2: int, y2: int,
+                               radius: int, fill_color: str) -> int:
+        """
+        Рисует закругленный прямоугольник.
+
+        :param x1, y1, x2, y2: Координаты прямоугольника
+        :param radius: Радиус закругления
+        :param fill_color: Цвет заливки
+        :return: Идентификатор созданного элемента canvas
+        """
+        # Без закругления рисуем обычный прямоугольник
+        if radius <= 0:
+            return self.create_rectangle(x1, y1, x2, y2, fill=fill_color, outline="")
+
+        points = self._translated_points(x1, y1, x2, y2, radius)
+        return self.create_polygon(points, fill=fill_color, outline="", smooth=True)
 
     def _bind_events(self) -> None:
         """Привязывает события мыши."""
@@ -576,18 +789,19 @@ class RoundedButton(tk.Canvas):
         self.bind("<ButtonRelease-1>", self._on_release)
         self.bind("<Enter>", self._on_enter)
         self.bind("<Leave>", self._on_leave)
+        self.bind("<Configure>", self._on_configure)
 
     def _on_press(self, event) -> None:
         """Обработчик нажатия кнопки."""
-        if str(self.cget('state')) != 'disabled':
+        if not self._is_disabled:
             self.is_pressed = True
-            self._draw_button()
+            self._request_redraw()
 
     def _on_release(self, event) -> None:
         """Обработчик отпускания кнопки."""
-        if str(self.cget('state')) != 'disabled':
+        if not self._is_disabled:
             self.is_pressed = False
-            self._draw_button()
+            self._request_redraw()
 
             # Выполняем команду если курсор все еще над кнопкой
             if self.is_hovered and self.command:
@@ -595,15 +809,33 @@ class RoundedButton(tk.Canvas):
 
     def _on_enter(self, event) -> None:
         """Обработчик входа курсора."""
-        if str(self.cget('state')) != 'disabled':
+        if not self._is_disabled:
             self.is_hovered = True
-            self._draw_button()
+            self._request_redraw()
 
     def _on_leave(self, event) -> None:
         """Обработчик выхода курсора."""
         self.is_hovered = False
         self.is_pressed = False
-        self._draw_button()
+        self._request_redraw()
+
+    def configure(self, cnf=None, **kw):
+        """
+        Настраивает canvas, отслеживая изменение состояния кнопки.
+
+        :param cnf: Словарь параметров
+        :param kw: Параметры виджета
+        """
+        # cnf может быть строкой при запросе параметра: configure('state')
+        state = kw.get('state', cnf.get('state') if isinstance(cnf, dict) else None)
+        if state is not None:
+            is_disabled = str(state) == 'disabled'
+            if is_disabled != self._is_disabled:
+                self._is_disabled = is_disabled
+                self._request_redraw()
+        return super().configure(cnf, **kw)
+
+    config = configure
 
     def configure_text(self, text: str) -> None:
         """
@@ -611,8 +843,11 @@ class RoundedButton(tk.Canvas):
 
         :param text: Новый текст
         """
+        if text == self.text:
+            return
+
         self.text = text
-        self._draw_button()
+        self._request_redraw()
 
     def configure_command(self, command: Optional[Callable]) -> None:
         """
@@ -4,10 +4,12 @@
 """
 
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, filedialog
 import os
+import stat
 import logging
-from typing import Optional, List
+from collections import deque
+from typing import Optional, List, Iterator, Callable
 
 # Попытка импорта tkinterdnd2 для drag & drop
 try:
@@ -23,6 +25,31 @@ except ImportError:
     MainPresenter = None
 
 
+def _walk(root: tk.Misc) -> Iterator[tk.Misc]:
+    """
+    Обходит дерево виджетов в ширину без рекурсии.
+
+    :param root: Корневой виджет (включается в обход)
+    :return: Итератор по виджетам
+    """
+    queue = deque([root])
+    while queue:
+        widget = queue.popleft()
+        yield widget
+        queue.extend(widget.winfo_children())
+
+
+# Классы виджетов, поддерживающие параметр bg
+_BG_WIDGET_TYPES = (tk.Label, tk.Frame, tk.Button)
+
+# Поддерживаемые расширения по умолчанию (без точки, в нижнем регистре)
+_DEFAULT_EXTENSIONS = frozenset({'png', 'jpg', 'jpeg', 'tiff', 'bmp', 'gif'})
+
+# Максимум записей каталога, просматриваемых в GUI-потоке при проверке папки;
+# при исчерпании папка передается presenter без проверки
+_SCAN_ENTRY_BUDGET = 2000
+
+
 class DragDropFrame(tk.Frame):
     """
     Виджет области для перетаскивания файлов.
@@ -46,9 +73,30 @@ class DragDropFrame(tk.Frame):
         self.original_bg_color = "#f8f9fa"
         self.drag_bg_color = "#e3f2fd"
         self.drag_border_color = "#2196f3"
-
-        # Поддерживаемые форматы
-        self.supported_formats = {'.png', '.jpg', '.jpeg', '.tiff', '.bmp', '.gif'}
+        # Тексты основной надписи (вычисляются один раз)
+        self._normal_text = ("Перетащите файлы изображений сюда" if HAS_DND_SUPPORT
+                             else "Используйте кнопки для добавления файлов")
+        self._drag_text = "📥 Отпустите файлы здесь"
+        # Последнее примененное оформление (повторное применение пропускается)
+        self._last_applied_drag = False
+
+        # Запомненный ответ о рекурсивном поиске в папках (None - спрашивать)
+        self._recursive_preference: Optional[bool] = None
+
+        # Включена ли область и зарегистрирована ли она как цель drop
+        self._enabled = True
+        self._dnd_registered = False
+        # Отложенное применение состояния drag (объединяет быстрые enter/leave)
+        self._pending_drag_state = False
+        self._applied_drag_state = False
+        self._drag_flush_job = None
+        # Текущий цвет фона дочерних виджетов (повторная перекраска пропускается)
+        self._current_bg = self.original_bg_color
+
+        # Поддерживаемые форматы (с точкой) и расширения для быстрой проверки (без точки)
+        self._extensions = _DEFAULT_EXTENSIONS
+        self.supported_formats = frozenset('.' + ext for ext in _DEFAULT_EXTENSIONS)
+        self._filetypes = self._build_filetypes()
 
         # Настройка внешнего вида
         self.configure(
@@ -92,10 +140,7 @@ class DragDropFrame(tk.Frame):
         icon_label.pack(pady=(10, 5))
 
         # Основной текст
-        if HAS_DND_SUPPORT:
-            main_text = "Перетащите файлы изображений сюда"
-        else:
-            main_text = "Drag & Drop не поддерживается"
+        main_text = self._normal_text if HAS_DND_SUPPORT else "Drag & Drop не поддерживается"
 
         self.main_label = tk.Label(
             main_container,
@@ -123,14 +168,17 @@ class DragDropFrame(tk.Frame):
 
         # Информация о поддерживаемых форматах
         formats_text = "Поддерживаемые форматы: PNG, JPG, JPEG, TIFF, BMP, GIF"
-        formats_label = tk.Label(
+        self._formats_label = tk.Label(
             main_container,
             text=formats_text,
             font=("Arial", 8),
             bg=self.original_bg_color,
             fg="#adb5bd"
         )
-        formats_label.pack(pady=(10, 5))
+        self._formats_label.pack(pady=(10, 5))
+
+        # Плоский список дочерних виджетов для перекраски фона (обход в ширину один раз)
+        self._bg_widgets = [w for w in _walk(main_container) if isinstance(w, _BG_WIDGET_TYPES)]
 
         # Привязываем клик для файлового диалога
         self._bind_click_events(main_container)
@@ -142,12 +190,8 @@ class DragDropFrame(tk.Frame):
         :param container: Контейнер с виджетами
         """
         # Привязываем клик ко всем виджетам в контейнере
-        def bind_recursive(widget):
+        for widget in _walk(container):
             widget.bind("<Button-1>", self._on_click)
-            for child in widget.winfo_children():
-                bind_recursive(child)
-
-        bind_recursive(container)
         self.bind("<Button-1>", self._on_click)
 
     def _setup_drag_drop(self) -> None:
@@ -160,6 +204,7 @@ class DragDropFrame(tk.Frame):
             self.dnd_bind('<<DropEnter>>', self._on_drag_enter)
             self.dnd_bind('<<DropLeave>>', self._on_drag_leave)
             self.dnd_bind('<<Drop>>', self._on_drop)
+            self._dnd_registered = True
 
             self.logger.info("Drag & Drop функциональность активирована")
 
@@ -169,38 +214,54 @@ class DragDropFrame(tk.Frame):
 
     def _setup_fallback_interface(self) -> None:
         """Настраивает интерфейс без drag & drop."""
-        self.main_label.configure(text="Используйте кнопки для добавления файлов")
+        self._normal_text = "Используйте кнопки для добавления файлов"
+        self.main_label.configure(text=self._normal_text)
         self.sub_label.configure(text="Drag & Drop недоступен в этой системе")
 
         # Изменяем цвета для обозначения отсутствия drag & drop
         self.configure(bg="#fff3cd", relief=tk.FLAT)
-        for child in self.winfo_children():
-            self._update_widget_bg(child, "#fff3cd")
+        self._update_widget_bg("#fff3cd")
 
-    def _update_widget_bg(self, widget: tk.Widget, color: str) -> None:
+    def _update_widget_bg(self, color: str) -> None:
         """
-        Рекурсивно обновляет цвет фона виджетов.
+        Обновляет цвет фона дочерних виджетов.
 
-        :param widget: Виджет для обновления
         :param color: Новый цвет фона
         """
-        try:
-            if hasattr(widget, 'configure'):
-                widget.configure(bg=color)
-            for child in widget.winfo_children():
-                self._update_widget_bg(child, color)
-        except tk.TclError:
-            pass  # Некоторые виджеты не поддерживают изменение bg
+        if color == self._current_bg:
+            return
+
+        self._current_bg = color
+        for widget in self._bg_widgets:
+            widget.configure(bg=color)
 
     def _on_drag_enter(self, event) -> None:
         """Обработчик входа в область drag."""
         self.is_drag_active = True
-        self._update_drag_appearance(True)
+        self._schedule_drag_state(True)
 
     def _on_drag_leave(self, event) -> None:
         """Обработчик выхода из области drag."""
         self.is_drag_active = False
-        self._update_drag_appearance(False)
+        self._schedule_drag_state(False)
+
+    def _schedule_drag_state(self, is_dragging: bool) -> None:
+        """
+        Запоминает состояние drag и планирует его применение.
+
+        :param is_dragging: True если идет перетаскивание
+        """
+        self._pending_drag_state = is_dragging
+        if self._drag_flush_job is None:
+            self._drag_flush_job = self.after(30, self._flush_drag_state)
+
+    def _flush_drag_state(self) -> None:
+        """Применяет последнее запомненное состояние drag, если оно изменилось."""
+        self._drag_flush_job = None
+        if self._pending_drag_state != self._applied_drag_state:
+            self._applied_drag_state = self._pending_drag_state
+            self._update_drag_appearance(self._applied_drag_state)
+            self.update_idletasks()
 
     def _on_drop(self, event) -> None:
         """
@@ -209,6 +270,11 @@ class DragDropFrame(tk.Frame):
         :param event: Событие с данными о файлах
         """
         self.is_drag_active = False
+        # Оформление сбрасывается сразу, без ожидания отложенного применения
+        if self._drag_flush_job is not None:
+            self.after_cancel(self._drag_flush_job)
+            self._drag_flush_job = None
+        self._pending_drag_state = self._applied_drag_state = False
         self._update_drag_appearance(False)
 
         try:
@@ -239,43 +305,9 @@ class DragDropFrame(tk.Frame):
         :param data: Строка с данными от drop события
         :return: Список путей к файлам
         """
-        # Удаляем фигурные скобки и разделяем по пробелам
-        if data.startswith('{') and data.endswith('}'):
-            data = data[1:-1]
-
-        # Разделяем пути, учитывая пробелы в именах файлов
-        paths = []
-        current_path = ""
-        in_quotes = False
-
-        i = 0
-        while i < len(data):
-            char = data[i]
-
-            if char == '"':
-                in_quotes = not in_quotes
-            elif char == ' ' and not in_quotes:
-                if current_path.strip():
-                    paths.append(current_path.strip())
-                    current_path = ""
-            else:
-                current_path += char
-
-            i += 1
-
-        # Добавляем последний путь
-        if current_path.strip():
-            paths.append(current_path.strip())
-
-        # Фильтруем только существующие пути
-        valid_paths = []
-        for path in paths:
-            # Удаляем лишние кавычки
-            clean_path = path.strip('"\'')
-            if os.path.exists(clean_path):
-                valid_paths.append(clean_path)
-
-        return valid_paths
+        # Список Tcl (пути с пробелами в фигурных скобках) разбирается средствами Tcl;
+        # существование путей проверяется при разделении на файлы и папки
+        return [path.strip('"\'') for path in self.tk.splitlist(data) if path]
 
     def _process_dropped_files(self, paths: List[str]) -> None:
         """
@@ -289,36 +321,153 @@ class DragDropFrame(tk.Frame):
 
         files_to_add = []
         directories_to_process = []
+        extensions = self._extensions
 
-        # Разделяем файлы и папки
+        # Разделяем файлы и папки за один проход (один stat на путь)
         for path in paths:
-            if os.path.isfile(path):
-                # Проверяем формат файла
-                _, ext = os.path.splitext(path)
-                if ext.lower() in self.supported_formats:
+            try:
+                mode = os.stat(path).st_mode
+            except OSError:
+                continue  # Путь не существует или недоступен
+
+            if stat.S_ISREG(mode):
+                # Проверяем формат файла по тексту после последней точки
+                _, dot, ext = path.rpartition('.')
+                if dot and ext.lower() in extensions:
                     files_to_add.append(path)
-            elif os.path.isdir(path):
+            elif stat.S_ISDIR(mode) and self._dir_has_images(
+                    path, recursive=self._recursive_preference is not False):
+                # Папки без изображений не передаются presenter и не вызывают вопрос
                 directories_to_process.append(path)
 
-        # Добавляем файлы
+        if not files_to_add and not directories_to_process:
+            messagebox.showwarning(
+                "Нет файлов",
+                "Не обнаружено поддерживаемых файлов изображений",
+                parent=self
+            )
+            return
+
+        # Итог всех добавлений показывается одним сообщением
+        total = {'added': [], 'skipped': [], 'invalid': []}
+
+        def merge(result: dict) -> None:
+            for key, items in total.items():
+                items.extend(result.get(key, []))
+
+        if not directories_to_process:
+            source_description = "файлов"
+        elif not files_to_add and len(directories_to_process) == 1:
+            source_description = f"из папки '{os.path.basename(directories_to_process[0])}'"
+        else:
+            source_description = "из перетащенных файлов и папок"
+
+        # Добавляем все файлы одним вызовом
         if files_to_add:
-            result = self.presenter.add_files(files_to_add)
-            self._show_add_result(result, "файлов")
-
-        # Обрабатываем папки
-        for directory in directories_to_process:
-            # Спрашиваем о рекурсивном поиске только для первой папки
-            if directory == directories_to_process[0] and len(directories_to_process) == 1:
-                recursive = messagebox.askyesno(
-                    "Поиск в подпапках",
-                    f"Искать изображения во всех подпапках папки '{os.path.basename(directory)}'?",
-                    parent=self
-                )
+            merge(self.presenter.add_files(files_to_add))
+
+        if not directories_to_process:
+            self._show_add_result(total, source_description)
+            return
+
+        def add_directories(recursive: bool) -> None:
+            for directory in directories_to_process:
+                merge(self.presenter.add_directory(directory, recursive))
+            self._show_add_result(total, source_description)
+
+        # Папки добавляются после завершения обработчика drop
+        if self._recursive_preference is not None:
+            self.after_idle(add_directories, self._recursive_preference)
+            return
+
+        # Спрашиваем о рекурсивном поиске один раз для всех папок, не блокируя обработчик
+        if len(directories_to_process) == 1:
+            question = (f"Искать изображения во всех подпапках папки "
+                        f"'{os.path.basename(directories_to_process[0])}'?")
+        else:
+            question = (f"Искать изображения во всех подпапках перетащенных папок "
+                        f"({len(directories_to_process)})?")
+        self._ask_recursive(
+            question,
+            on_answer=add_directories,
+            on_cancel=lambda: self._show_add_result(total, source_description)
+        )
+
+    def _ask_recursive(self, question: str, on_answer: Callable[[bool], None],
+                       on_cancel: Callable[[], None]) -> None:
+        """
+        Показывает немодальный вопрос о рекурсивном поиске с возможностью запомнить ответ.
+
+        :param question: Текст вопроса
+        :param on_answer: Вызывается с ответом (True - искать в подпапках)
+        :param on_cancel: Вызывается при закрытии окна без ответа
+        """
+        window = tk.Toplevel(self)
+        window.title("Поиск в подпапках")
+        window.resizable(False, False)
+        window.transient(self.winfo_toplevel())
+
+        remember_var = tk.BooleanVar(window, value=False)
+
+        def answer(recursive: Optional[bool]) -> None:
+            if recursive is not None and remember_var.get():
+                self._recursive_preference = recursive
+            window.destroy()
+            if recursive is None:
+                self.after_idle(on_cancel)
             else:
-                recursive = False  # Для множественных папок используем простой поиск
+                self.after_idle(on_answer, recursive)
+
+        window.protocol("WM_DELETE_WINDOW", lambda: answer(None))
+
+        frame = tk.Frame(window, padx=20, pady=15)
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        tk.Label(frame, text=question, justify=tk.LEFT).pack(anchor=tk.W, pady=(0, 10))
+        tk.Checkbutton(frame, text="Запомнить выбор", variable=remember_var).pack(anchor=tk.W, pady=(0, 15))
+
+        buttons = tk.Frame(frame)
+        buttons.pack(fill=tk.X)
+        tk.Button(buttons, text="Нет", width=10,
+                  command=lambda: answer(False)).pack(side=tk.RIGHT)
+        tk.Button(buttons, text="Да", width=10,
+                  command=lambda: answer(True)).pack(side=tk.RIGHT, padx=(0, 5))
 
-            result = self.presenter.add_directory(directory, recursive)
-            self._show_add_result(result, f"из папки '{os.path.basename(directory)}'")
+        window.lift()
+        window.focus_set()
+
+    def _dir_has_images(self, path: str, recursive: bool) -> bool:
+        """
+        Проверяет, есть ли в папке хотя бы одно поддерживаемое изображение.
+        Просматривает не более _SCAN_ENTRY_BUDGET записей, чтобы не блокировать GUI.
+
+        :param path: Путь к папке
+        :param recursive: Проверять ли подпапки
+        :return: True при первом найденном изображении или исчерпании лимита
+        """
+        extensions = self._extensions
+        budget = _SCAN_ENTRY_BUDGET
+        queue = deque([path])
+        while queue:
+            try:
+                with os.scandir(queue.popleft()) as entries:
+                    for entry in entries:
+                        budget -= 1
+                        if budget < 0:
+                            # Окончательное решение примет presenter
+                            return True
+                        try:
+                            if entry.is_file():
+                                _, dot, ext = entry.name.rpartition('.')
+                                if dot and ext.lower() in extensions:
+                                    return True
+                            elif recursive and entry.is_dir(follow_symlinks=False):
+                                queue.append(entry.path)
+                        except OSError:
+                            continue
+            except OSError:
+                continue  # Папка недоступна
+        return False
 
     def _show_add_result(self, result: dict, source_description: str) -> None:
         """
@@ -362,6 +511,10 @@ class DragDropFrame(tk.Frame):
 
         :param is_dragging: True если идет перетаскивание
         """
+        if is_dragging == self._last_applied_drag:
+            return
+        self._last_applied_drag = is_dragging
+
         if is_dragging:
             # Стиль во время перетаскивания
             self.configure(
@@ -373,13 +526,12 @@ class DragDropFrame(tk.Frame):
             # Обновляем текст
             if hasattr(self, 'main_label'):
                 self.main_label.configure(
-                    text="📥 Отпустите файлы здесь",
+                    text=self._drag_text,
                     fg=self.drag_border_color
                 )
 
             # Обновляем цвет фона дочерних виджетов
-            for child in self.winfo_children():
-                self._update_widget_bg(child, self.drag_bg_color)
+            self._update_widget_bg(self.drag_bg_color)
         else:
             # Обычный стиль
             self.configure(
@@ -390,37 +542,22 @@ class DragDropFrame(tk.Frame):
 
             # Восстанавливаем текст
             if hasattr(self, 'main_label'):
-                if HAS_DND_SUPPORT:
-                    text = "Перетащите файлы изображений сюда"
-                else:
-                    text = "Используйте кнопки для добавления файлов"
-
                 self.main_label.configure(
-                    text=text,
+                    text=self._normal_text,
                     fg="#495057"
                 )
 
             # Восстанавливаем цвет фона дочерних виджетов
-            for child in self.winfo_children():
-                self._update_widget_bg(child, self.original_bg_color)
+            self._update_widget_bg(self.original_bg_color)
 
     def _on_click(self, event) -> None:
         """Обработчик клика для открытия файлового диалога."""
-        if not self.presenter:
+        if not self.presenter or not self._enabled:
             return
 
-        from tkinter import filedialog
-
-        filetypes = [
-            ("Изображения", "*.png *.jpg *.jpeg *.tiff *.bmp *.gif"),
-            ("PNG файлы", "*.png"),
-            ("JPEG файлы", "*.jpg *.jpeg"),
-            ("Все файлы", "*.*")
-        ]
-
         files = filedialog.askopenfilenames(
             title="Выберите изображения",
-            filetypes=filetypes,
+            filetypes=self._filetypes,
             parent=self
         )
 
@@ -428,25 +565,39 @@ class DragDropFrame(tk.Frame):
             result = self.presenter.add_files(list(files))
             self._show_add_result(result, "через диалог выбора")
 
+    def _build_filetypes(self) -> tuple:
+        """
+        Строит фильтры файлового диалога по поддерживаемым расширениям.
+
+        :return: Кортеж фильтров для filedialog
+        """
+        extensions = sorted(self._extensions)
+        filetypes = [("Изображения", " ".join(f"*.{ext}" for ext in extensions))]
+        if 'png' in self._extensions:
+            filetypes.append(("PNG файлы", "*.png"))
+        jpeg = [f"*.{ext}" for ext in ('jpg', 'jpeg') if ext in self._extensions]
+        if jpeg:
+            filetypes.append(("JPEG файлы", " ".join(jpeg)))
+        filetypes.append(("Все файлы", "*.*"))
+        return tuple(filetypes)
+
     def update_supported_formats(self, formats: set) -> None:
         """
         Обновляет список поддерживаемых форматов.
 
         :param formats: Новый набор поддерживаемых форматов
         """
-        self.supported_formats = formats
+        # Нормализуем форматы один раз при обновлении
+        self._extensions = frozenset(fmt.lower().lstrip('.') for fmt in formats)
+        self.supported_formats = frozenset('.' + ext for ext in self._extensions)
+        self._filetypes = self._build_filetypes()
 
         # Обновляем текст с форматами
         formats_text = "Поддерживаемые форматы: " + ", ".join(
-            fmt.upper().lstrip('.') for fmt in sorted(formats)
+            ext.upper() for ext in sorted(self._extensions)
         )
 
-        # Находим и обновляем label с форматами
-        for child in self.winfo_children():
-            for subchild in child.winfo_children():
-                if isinstance(subchild, tk.Label) and "Поддерживаемые форматы" in subchild.cget("text"):
-                    subchild.configure(text=formats_text)
-                    break
+        self._formats_label.configure(text=formats_text)
 
     def set_enabled(self, enabled: bool) -> None:
         """
@@ -454,16 +605,21 @@ class DragDropFrame(tk.Frame):
 
         :param enabled: True для включения, False для отключения
         """
+        if enabled == self._enabled:
+            return
+        self._enabled = enabled
+
+        # Отключенная область снимается с регистрации, чтобы не участвовать в диспетчеризации drop
+        if self._dnd_registered:
+            if enabled:
+                self.drop_target_register(DND_FILES)
+            else:
+                self.drop_target_unregister()
+
         if enabled:
-            self.configure(state=tk.NORMAL)
             if hasattr(self, 'main_label'):
-                if HAS_DND_SUPPORT:
-                    self.main_label.configure(text="Перетащите файлы изображений сюда")
-                else:
-                    self.main_label.configure(text="Используйте кнопки для добавления файлов")
-                self.main_label.configure(fg="#495057")
+                self.main_label.configure(text=self._normal_text, fg="#495057")
         else:
-            self.configure(state=tk.DISABLED)
             if hasattr(self, 'main_label'):
                 self.main_label.configure(
                     text="Добавление файлов отключено во время обработки",
@@ -480,5 +636,5 @@ class DragDropFrame(tk.Frame):
             'has_dnd_support': HAS_DND_SUPPORT,
             'is_drag_active': self.is_drag_active,
             'supported_formats': list(self.supported_formats),
-            'is_enabled': str(self.cget('state')) != 'disabled'
+            'is_enabled': self._enabled
         }
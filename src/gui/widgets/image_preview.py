@@ -7,7 +7,35 @@ import tkinter as tk
 from PIL import Image, ImageTk
 import os
 import logging
-from typing import Optional
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Tuple
+
+# Пул для декодирования миниатюр вне потока GUI
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="image-preview")
+
+# Завершенные задачи декодирования: заполняется рабочими потоками, разбирается в потоке GUI
+_RESULTS: "queue.Queue[tuple]" = queue.Queue()
+
+
+@lru_cache(maxsize=512)
+def _get_thumb_bytes(path: str, size: int, mtime_ns: int) -> Tuple[str, Tuple[int, int], bytes]:
+    """
+    Декодирует и уменьшает изображение (результат кэшируется по пути, размеру и времени изменения).
+
+    :param path: Путь к изображению
+    :param size: Размер миниатюры
+    :param mtime_ns: Время изменения файла (меняет ключ кэша при изменении файла)
+    :return: Режим, размер и байты миниатюры
+    """
+    with Image.open(path) as img:
+        # Для JPEG декодирование сразу в уменьшенном разрешении
+        img.draft('RGB', (size * 2, size * 2))
+        img.thumbnail((size, size), Image.Resampling.BILINEAR)
+        if img.mode not in ('RGB', 'RGBA', 'L'):
+            img = img.convert('RGBA')
+        return img.mode, img.size, img.tobytes()
 
 
 class ImagePreview(tk.Label):
@@ -15,6 +43,11 @@ class ImagePreview(tk.Label):
     Виджет для отображения миниатюры изображения.
     """
 
+    # Период разбора готовых миниатюр (мс); опрос идет только пока есть незавершенные загрузки
+    _POLL_MS = 30
+    _poll_id: Optional[str] = None
+    _pending = 0
+
     def __init__(self, parent: tk.Widget, image_path: str = "", size: int = 64, **kwargs):
         """
         Инициализация виджета предпросмотра.
@@ -30,33 +63,102 @@ class ImagePreview(tk.Label):
         self.image_path = image_path
         self.size = size
         self.photo_image: Optional[ImageTk.PhotoImage] = None
+        # Номер последней запрошенной загрузки (устаревшие результаты отбрасываются)
+        self._load_token = 0
 
+        # Изображение загружается при первом отображении виджета
         if image_path:
-            self.load_image(image_path)
+            self._map_binding = self.bind("<Map>", self._on_first_map)
+
+    def _on_first_map(self, event) -> None:
+        """Загружает изображение при первом отображении виджета."""
+        self.unbind("<Map>", self._map_binding)
+        self.load_image(self.image_path)
 
     def load_image(self, image_path: str) -> bool:
         """
-        Загружает и отображает изображение.
+        Запускает фоновую загрузку изображения и показывает заглушку до ее завершения.
 
         :param image_path: Путь к изображению
-        :return: True если загрузка успешна
+        :return: True если загрузка запущена
+        """
+        self.image_path = image_path
+        self._load_token += 1
+        token = self._load_token
+
+        self.configure(text="⏳", image="", font=("Arial", 16))
+        future = _EXECUTOR.submit(self._decode, image_path, self.size)
+        # Рабочий поток только кладет результат в очередь - Tk из него не вызывается
+        future.add_done_callback(lambda f: _RESULTS.put((self, f, token, image_path)))
+
+        ImagePreview._pending += 1
+        if ImagePreview._poll_id is None:
+            root = self._root()
+            ImagePreview._poll_id = root.after(self._POLL_MS, ImagePreview._poll_results, root)
+        return True
+
+    @classmethod
+    def _poll_results(cls, root: tk.Misc) -> None:
+        """
+        Отображает готовые миниатюры и планирует следующий опрос (поток GUI).
+
+        :param root: Корневое окно, через которое планируется опрос
         """
+        cls._poll_id = None
+        while True:
+            try:
+                preview, future, token, image_path = _RESULTS.get_nowait()
+            except queue.Empty:
+                break
+
+            cls._pending -= 1
+            try:
+                preview._apply_image(future, token, image_path)
+            except tk.TclError:
+                pass  # Виджет уничтожен до завершения загрузки
+
+        if cls._pending > 0:
+            cls._poll_id = root.after(cls._POLL_MS, cls._poll_results, root)
+
+    @staticmethod
+    def _decode(image_path: str, size: int) -> Optional[Tuple[str, Tuple[int, int], bytes]]:
+        """
+        Декодирует миниатюру в рабочем потоке.
+
+        :param image_path: Путь к изображению
+        :param size: Размер миниатюры
+        :return: Режим, размер и байты миниатюры или None если файл не найден
+        """
+        try:
+            mtime_ns = os.stat(image_path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+        return _get_thumb_bytes(image_path, size, mtime_ns)
+
+    def _apply_image(self, future: Future, token: int, image_path: str) -> None:
+        """
+        Создает PhotoImage и отображает миниатюру (выполняется в потоке GUI).
+
+        :param future: Завершенная задача декодирования
+        :param token: Номер загрузки
+        :param image_path: Путь к изображению
+        """
+        if token != self._load_token:
+            return  # За это время запрошено другое изображение
+
         try:
-            if not os.path.exists(image_path):
+            thumb = future.result()
+            if thumb is None:
                 self._show_error_image()
-                return False
+                return
 
-            # Загружаем и изменяем размер
-            with Image.open(image_path) as img:
-                img.thumbnail((self.size, self.size), Image.Resampling.LANCZOS)
-                self.photo_image = ImageTk.PhotoImage(img)
-                self.configure(image=self.photo_image)
-                return True
+            mode, size, data = thumb
+            self.photo_image = ImageTk.PhotoImage(Image.frombytes(mode, size, data))
+            self.configure(image=self.photo_image, text="")
 
         except Exception as e:
             self.logger.warning(f"Не удалось загрузить изображение {image_path}: {e}")
             self._show_error_image()
-            return False
 
     def _show_error_image(self):
         """Показывает заглушку при ошибке загрузки."""